@@ -1,19 +1,23 @@
 
+import sys
+
 from typing import Any, Optional
 
 class AppContext:
 
+    __slots__ = ("_services",)
+
     def __init__(self):
 
         self._services: dict[str, Any] = {}
 
     def register(self, name: str, service: Any) -> None:
 
-        if name in self._services:
+        name = sys.intern(name)
 
-            raise ValueError(f"Service '{name}' is already registered")
+        if self._services.setdefault(name, service) is not service:
 
-        self._services[name] = service
+            raise ValueError(f"Service '{name}' is already registered")
 
     def get(self, name: str) -> Optional[Any]:
 
@@ -23,11 +27,13 @@ class AppContext:
 
         return name in self._services
 
-    def unregister(self, name: str) -> None:
+    def __contains__(self, name: str) -> bool:
+
+        return name in self._services
 
-        if name in self._services:
+    def unregister(self, name: str) -> None:
 
-            del self._services[name]
+        self._services.pop(name, None)
 
     def clear(self) -> None:
 
@@ -1,7 +1,7 @@
 
-import json
+import os
 
-import platform
+import sys
 
 from dataclasses import dataclass, asdict, field
 
@@ -9,9 +9,13 @@ from pathlib import Path
 
 from typing import Optional
 
+import orjson
+
 from nextlib.utils.file import make_dir
 
-@dataclass
+_SYSTEM = sys.platform
+
+@dataclass(slots=True)
 
 class AppData:
 
@@ -41,6 +45,12 @@ class AppData:
 
     _user_path_linux: str = field(default="", init=False, repr=False)
 
+    _initialized: bool = field(default=False, init=False, repr=False)
+
+    _icons_dir: Optional[Path] = field(default=None, init=False, repr=False)
+
+    _icon_names: Optional[frozenset] = field(default=None, init=False, repr=False)
+
     def __post_init__(self):
 
         self.app_path = str(Path(__file__).resolve().parents[1])
@@ -51,6 +61,8 @@ class AppData:
 
         self.res_path = str(Path(self.app_path) / "res")
 
+        self._icons_dir = Path(self.res_path) / "icons"
+
         self._user_path_win = str(
             Path.home() / "AppData" / "Local" / "NEXTfoam" / self.name / self.version
         )
@@ -67,19 +79,23 @@ class AppData:
 
     def init(self) -> None:
 
+        if self._initialized:
+
+            return
+
         self._resolve_user_path()
 
         self._ensure_dirs()
 
-    def _resolve_user_path(self) -> None:
+        self._initialized = True
 
-        system = platform.system()
+    def _resolve_user_path(self) -> None:
 
-        if system == "Windows":
+        if _SYSTEM == "win32":
 
             self.user_path = self._user_path_win
 
-        elif system == "Linux":
+        elif _SYSTEM.startswith("linux"):
 
             self.user_path = self._user_path_linux
 
@@ -91,13 +107,25 @@ class AppData:
 
         make_dir(self.user_path, exist_ok=True)
 
-        for path_name in ["app_path", "config_path", "res_path"]:
+        try:
+
+            with os.scandir(self.app_path) as it:
+
+                entries = {entry.name for entry in it}
+
+        except OSError:
+
+            print(f"Warning: app_path does not exist: {self.app_path}")
+
+            return
 
-            path = getattr(self, path_name)
+        if "config" not in entries:
 
-            if not Path(path).exists():
+            print(f"Warning: config_path does not exist: {self.config_path}")
 
-                print(f"Warning: {path_name} does not exist: {path}")
+        if "res" not in entries:
+
+            print(f"Warning: res_path does not exist: {self.res_path}")
 
     def add_recent_case(self, path: str, max_count: int = 10) -> None:
 
@@ -117,15 +145,19 @@ class AppData:
 
     def save(self) -> None:
 
+        self.init()
+
         file_path = Path(self.user_path) / "app_data.json"
 
         try:
 
-            with open(file_path, "w", encoding="utf-8") as f:
+            data = {k: v for k, v in asdict(self).items() if not k.startswith("_")}
+
+            tmp_path = file_path.with_suffix(".json.tmp")
 
-                data = {k: v for k, v in asdict(self).items() if not k.startswith("_")}
+            tmp_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
-                json.dump(data, f, ensure_ascii=False, indent=4)
+            os.replace(tmp_path, file_path)
 
         except Exception as e:
 
@@ -133,30 +165,33 @@ class AppData:
 
     def load(self) -> None:
 
+        self.init()
+
         file_path = Path(self.user_path) / "app_data.json"
 
-        if not file_path.exists():
+        try:
 
-            return
+            data = orjson.loads(file_path.read_bytes())
 
-        try:
+            self.name = data.get("name", self.name)
 
-            with open(file_path, "r", encoding="utf-8") as f:
+            self.version = data.get("version", self.version)
 
-                data = json.load(f)
+            self.window_geometry = data.get("window_geometry", self.window_geometry)
 
-            safe_fields = {
-                "name", "version",
-                "window_geometry",
-                "parallel_mesh_enabled", "parallel_run_enabled",
-                "recent_cases",
-            }
+            self.parallel_mesh_enabled = data.get(
+                "parallel_mesh_enabled", self.parallel_mesh_enabled
+            )
 
-            for k, v in data.items():
+            self.parallel_run_enabled = data.get(
+                "parallel_run_enabled", self.parallel_run_enabled
+            )
 
-                if k in safe_fields:
+            self.recent_cases = data.get("recent_cases", self.recent_cases)
 
-                    setattr(self, k, v)
+        except FileNotFoundError:
+
+            return
 
         except Exception as e:
 
@@ -168,7 +203,21 @@ class AppData:
 
     def get_icon_path(self, icon_name: str) -> Optional[Path]:
 
-        icon_path = Path(self.res_path) / "icons" / icon_name
+        if self._icon_names is None:
+
+            try:
+
+                self._icon_names = frozenset(os.listdir(self._icons_dir))
+
+            except OSError:
+
+                self._icon_names = frozenset()
+
+        if icon_name not in self._icon_names and os.path.basename(icon_name) == icon_name:
+
+            return None
+
+        icon_path = self._icons_dir / icon_name
 
         return icon_path if icon_path.exists() else None
 
@@ -181,5 +230,3 @@ class AppData:
 
 app_data = AppData()
 
-app_data.init()
-
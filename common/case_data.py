@@ -1,7 +1,9 @@
 
-import json
+import os
 
-from dataclasses import dataclass, asdict, field
+import sys
+
+from dataclasses import dataclass, field, fields
 
 from datetime import datetime
 
@@ -9,23 +11,119 @@ from pathlib import Path
 
 from typing import Optional
 
+import numpy as np
+
+import orjson
+
 from nextlib.base.basecase import BaseCase
 
-@dataclass
+_ZERO3 = (0.0, 0.0, 0.0)
+
+class _TransformTable:
+
+    def __init__(self, capacity: int = 8):
+
+        self.pos = np.zeros((capacity, 3))
+
+        self.rot = np.zeros((capacity, 3))
+
+        self.probe = np.zeros((capacity, 3))
+
+        self.names: list[str] = []
+
+    def __len__(self) -> int:
+
+        return len(self.names)
+
+    def append(self, name: str, position, rotation, probe_position) -> int:
+
+        row = len(self.names)
+
+        if row == self.pos.shape[0]:
+
+            self._grow(max(2 * row, 1))
+
+        self.pos[row] = position
+
+        self.rot[row] = rotation
+
+        self.probe[row] = probe_position
+
+        self.names.append(name)
+
+        return row
+
+    def remove(self, row: int) -> Optional[str]:
+
+        last = len(self.names) - 1
+
+        moved = None
+
+        if row != last:
+
+            self.pos[row] = self.pos[last]
+
+            self.rot[row] = self.rot[last]
+
+            self.probe[row] = self.probe[last]
+
+            moved = self.names[last]
+
+            self.names[row] = moved
+
+        self.names.pop()
+
+        return moved
+
+    def _grow(self, capacity: int) -> None:
+
+        for attr in ("pos", "rot", "probe"):
+
+            old = getattr(self, attr)
+
+            new = np.zeros((capacity, 3))
+
+            new[:old.shape[0]] = old
+
+            setattr(self, attr, new)
+
+@dataclass(init=False, repr=False, eq=False, slots=True)
 
 class GeometryData:
 
     name: str = ""
 
-    path: str = ""
-
     is_visible: bool = True
 
-    position: tuple[float, float, float] = field(default_factory=lambda: (0.0, 0.0, 0.0))
+    _parent: str = ""
+
+    _file: str = ""
+
+    _table: _TransformTable = field(default=None, repr=False, compare=False)
+
+    _row: int = field(default=0, repr=False, compare=False)
+
+    def __init__(
+        self,
+        name: str = "",
+        path: str = "",
+        is_visible: bool = True,
+        position: tuple[float, float, float] = (0.0, 0.0, 0.0),
+        rotation: tuple[float, float, float] = (0.0, 0.0, 0.0),
+        probe_position: tuple[float, float, float] = (0.0, 0.0, 0.0),
+    ):
+
+        self.name = name
 
-    rotation: tuple[float, float, float] = field(default_factory=lambda: (0.0, 0.0, 0.0))
+        self.path = path
 
-    probe_position: tuple[float, float, float] = field(default_factory=lambda: (0.0, 0.0, 0.0))
+        self.is_visible = is_visible
+
+        self._table = _TransformTable(1)
+
+        self._row = self._table.append(name, position, rotation, probe_position)
+
+        self.__post_init__()
 
     def __post_init__(self):
 
@@ -33,9 +131,100 @@ class GeometryData:
 
             raise ValueError("Geometry path must be provided with name")
 
+    @property
+
+    def path(self) -> str:
+
+        if not self._parent:
+
+            return self._file
+
+        return os.path.join(self._parent, self._file)
+
+    @path.setter
+
+    def path(self, value: str) -> None:
+
+        parent, self._file = os.path.split(value)
+
+        self._parent = sys.intern(parent)
+
+    @property
+
+    def position(self) -> tuple[float, float, float]:
+
+        return tuple(self._table.pos[self._row].tolist())
+
+    @position.setter
+
+    def position(self, value: tuple[float, float, float]) -> None:
+
+        self._table.pos[self._row] = value
+
+    @property
+
+    def rotation(self) -> tuple[float, float, float]:
+
+        return tuple(self._table.rot[self._row].tolist())
+
+    @rotation.setter
+
+    def rotation(self, value: tuple[float, float, float]) -> None:
+
+        self._table.rot[self._row] = value
+
+    @property
+
+    def probe_position(self) -> tuple[float, float, float]:
+
+        return tuple(self._table.probe[self._row].tolist())
+
+    @probe_position.setter
+
+    def probe_position(self, value: tuple[float, float, float]) -> None:
+
+        self._table.probe[self._row] = value
+
+    def _values(self) -> tuple:
+
+        return (self.name, self.path, self.is_visible, self.position, self.rotation, self.probe_position)
+
+    def __eq__(self, other) -> bool:
+
+        if other.__class__ is not self.__class__:
+
+            return NotImplemented
+
+        return self._values() == other._values()
+
+    def __repr__(self) -> str:
+
+        return (
+            f"{self.__class__.__qualname__}(name={self.name!r}, path={self.path!r}, "
+            f"is_visible={self.is_visible!r}, position={self.position!r}, "
+            f"rotation={self.rotation!r}, probe_position={self.probe_position!r})"
+        )
+
+    def _detach(self) -> None:
+
+        table = _TransformTable(1)
+
+        table.append(self.name, self.position, self.rotation, self.probe_position)
+
+        self._table = table
+
+        self._row = 0
+
     def to_dict(self) -> dict:
 
-        return asdict(self)
+        return {
+            "name": self.name,
+            "path": self.path,
+            "is_visible": self.is_visible,
+            "position": self.position,
+            "rotation": self.rotation,
+            "probe_position": self.probe_position,
+        }
 
     @classmethod
 
@@ -61,6 +250,38 @@ class GeometryData:
 
         return cls(**data)
 
+    @classmethod
+
+    def from_dict_fast(
+        cls,
+        data: dict,
+        table: Optional[_TransformTable] = None,
+        key: Optional[str] = None,
+    ) -> "GeometryData":
+
+        obj = cls.__new__(cls)
+
+        obj.name = data.get("name", "")
+
+        obj.path = data.get("path", "")
+
+        obj.is_visible = data.get("is_visible", True)
+
+        if table is None:
+
+            table = _TransformTable(1)
+
+        obj._table = table
+
+        obj._row = table.append(
+            obj.name if key is None else key,
+            data.get("position") or _ZERO3,
+            data.get("rotation") or _ZERO3,
+            data.get("probe_position") or _ZERO3,
+        )
+
+        return obj
+
 @dataclass
 
 class CaseData(BaseCase):
@@ -83,7 +304,75 @@ class CaseData(BaseCase):
 
         super().__post_init__()
 
-    def add_geometry(self, file_path: str) -> str:
+        self._transforms = _TransformTable()
+
+        self._index: dict[str, int] = {}
+
+        for name, geo in list(self.objects.items()):
+
+            self._bind_geometry(name, geo)
+
+        self._dirty = True
+
+        self._mtime_dirty = False
+
+    def _bind_geometry(self, name: str, geo: GeometryData) -> None:
+
+        name = sys.intern(name)
+
+        if name in self._index:
+
+            self._unbind_geometry(name)
+
+        row = self._transforms.append(
+            name, geo.position, geo.rotation, geo.probe_position
+        )
+
+        geo._table = self._transforms
+
+        geo._row = row
+
+        self._index[name] = row
+
+        self.objects[name] = geo
+
+    def _unbind_geometry(self, name: str) -> Optional[GeometryData]:
+
+        geo = self.objects.pop(name, None)
+
+        row = self._index.pop(name, None)
+
+        if geo is None or row is None:
+
+            return geo
+
+        geo._detach()
+
+        moved = self._transforms.remove(row)
+
+        if moved is not None:
+
+            self._index[moved] = row
+
+            self.objects[moved]._row = row
+
+        return geo
+
+    def _reset_geometries(self) -> None:
+
+        self.objects.clear()
+
+        self._index.clear()
+
+        self._transforms = _TransformTable()
+
+    def add_geometry_data(self, geo: GeometryData) -> None:
+
+        self._bind_geometry(geo.name, geo)
+
+        self._update_modified_time()
+
+    def add_geometry(self, file_path: str, resolve_symlinks: bool = False) -> str:
 
         path = Path(file_path)
 
@@ -91,18 +380,26 @@ class CaseData(BaseCase):
 
             raise FileNotFoundError(f"Geometry file not found: {file_path}")
 
-        name = path.stem
+        if path.is_absolute() and not resolve_symlinks:
+
+            abs_path = os.path.normpath(str(path))
+
+        else:
+
+            abs_path = str(path.resolve())
+
+        name = sys.intern(path.stem)
 
         if name in self.objects:
 
-            self.objects[name].path = str(path.resolve())
+            self.objects[name].path = abs_path
 
             self._update_modified_time()
 
             return name
 
-        self.objects[name] = GeometryData(
-            name=name, path=str(path.resolve()), is_visible=True
+        self._bind_geometry(
+            name, GeometryData(name=name, path=abs_path, is_visible=True)
         )
 
         self._update_modified_time()
@@ -121,7 +418,7 @@ class CaseData(BaseCase):
 
             return False
 
-        del self.objects[name]
+        self._unbind_geometry(name)
 
         self._update_modified_time()
 
@@ -151,11 +448,13 @@ class CaseData(BaseCase):
         self, name: str, x: float, y: float, z: float
     ) -> bool:
 
-        if name not in self.objects:
+        row = self._index.get(name)
+
+        if row is None:
 
             return False
 
-        self.objects[name].position = (x, y, z)
+        self._transforms.pos[row] = (x, y, z)
 
         self._update_modified_time()
 
@@ -163,21 +462,25 @@ class CaseData(BaseCase):
 
     def get_geometry_position(self, name: str) -> Optional[tuple[float, float, float]]:
 
-        if name not in self.objects:
+        row = self._index.get(name)
+
+        if row is None:
 
             return None
 
-        return self.objects[name].position
+        return tuple(self._transforms.pos[row].tolist())
 
     def set_geometry_rotation(
         self, name: str, rx: float, ry: float, rz: float
     ) -> bool:
 
-        if name not in self.objects:
+        row = self._index.get(name)
+
+        if row is None:
 
             return False
 
-        self.objects[name].rotation = (rx, ry, rz)
+        self._transforms.rot[row] = (rx, ry, rz)
 
         self._update_modified_time()
 
@@ -185,21 +488,25 @@ class CaseData(BaseCase):
 
     def get_geometry_rotation(self, name: str) -> Optional[tuple[float, float, float]]:
 
-        if name not in self.objects:
+        row = self._index.get(name)
+
+        if row is None:
 
             return None
 
-        return self.objects[name].rotation
+        return tuple(self._transforms.rot[row].tolist())
 
     def set_geometry_probe_position(
         self, name: str, x: float, y: float, z: float
     ) -> bool:
 
-        if name not in self.objects:
+        row = self._index.get(name)
+
+        if row is None:
 
             return False
 
-        self.objects[name].probe_position = (x, y, z)
+        self._transforms.probe[row] = (x, y, z)
 
         self._update_modified_time()
 
@@ -207,29 +514,67 @@ class CaseData(BaseCase):
 
     def get_geometry_probe_position(self, name: str) -> Optional[tuple[float, float, float]]:
 
-        if name not in self.objects:
+        row = self._index.get(name)
+
+        if row is None:
 
             return None
 
-        return getattr(self.objects[name], 'probe_position', None)
+        return tuple(self._transforms.probe[row].tolist())
 
     def clear_geometries(self, keep_protected: bool = True) -> None:
 
-        if keep_protected:
+        fluid = self.objects.pop("fluid", None) if keep_protected else None
 
-            self.objects = {
-                k: v for k, v in self.objects.items() if k == "fluid"
-            }
+        self._reset_geometries()
 
-        else:
+        if fluid is not None:
 
-            self.objects.clear()
+            self._bind_geometry("fluid", fluid)
 
         self._update_modified_time()
 
     def _update_modified_time(self) -> None:
 
-        self.modified_time = datetime.now().isoformat(timespec="seconds")
+        self._mtime_dirty = True
+
+        self._dirty = True
+
+    def _flush_modified_time(self) -> None:
+
+        if self._mtime_dirty:
+
+            self.modified_time = datetime.now().isoformat(timespec="seconds")
+
+            self._mtime_dirty = False
+
+    def _to_save_dict(self) -> dict:
+
+        self._flush_modified_time()
+
+        data = {f.name: getattr(self, f.name) for f in fields(self)}
+
+        pos = self._transforms.pos.tolist()
+
+        rot = self._transforms.rot.tolist()
+
+        probe = self._transforms.probe.tolist()
+
+        index = self._index
+
+        data["objects"] = {
+            n: {
+                "name": g.name,
+                "path": g.path,
+                "is_visible": g.is_visible,
+                "position": pos[index[n]],
+                "rotation": rot[index[n]],
+                "probe_position": probe[index[n]],
+            }
+            for n, g in self.objects.items()
+        }
+
+        return data
 
     def save(self) -> None:
 
@@ -239,20 +584,26 @@ class CaseData(BaseCase):
 
             return
 
+        if not self._dirty:
+
+            return
+
         file_path = Path(self.path) / "case_data.json"
 
         try:
 
-            data = asdict(self)
+            tmp_path = file_path.with_suffix(".json.tmp")
 
-            data["objects"] = {
-                name: obj.to_dict() if hasattr(obj, "to_dict") else asdict(obj)
-                for name, obj in self.objects.items()
-            }
+            tmp_path.write_bytes(
+                orjson.dumps(
+                    self._to_save_dict(),
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                )
+            )
 
-            with open(file_path, "w", encoding="utf-8") as f:
+            os.replace(tmp_path, file_path)
 
-                json.dump(data, f, ensure_ascii=False, indent=4)
+            self._dirty = False
 
         except Exception as e:
 
@@ -268,28 +619,47 @@ class CaseData(BaseCase):
 
         file_path = Path(self.path) / "case_data.json"
 
-        if not file_path.exists():
-
-            return
-
         try:
 
-            with open(file_path, "r", encoding="utf-8") as f:
-
-                data = json.load(f)
+            data = orjson.loads(file_path.read_bytes())
 
             self.created_time = data.get("created_time", self.created_time)
 
             self.modified_time = data.get("modified_time", self.modified_time)
 
+            self._mtime_dirty = False
+
             self.description = data.get("description", "")
 
             objects_data = data.get("objects", {})
 
-            self.objects = {
-                name: GeometryData.from_dict(obj_data)
-                for name, obj_data in objects_data.items()
-            }
+            table = _TransformTable(max(len(objects_data), 8))
+
+            objects = {}
+
+            index = {}
+
+            for name, obj_data in objects_data.items():
+
+                name = sys.intern(name)
+
+                geo = GeometryData.from_dict_fast(obj_data, table, name)
+
+                objects[name] = geo
+
+                index[name] = geo._row
+
+            self.objects = objects
+
+            self._index = index
+
+            self._transforms = table
+
+            self._dirty = False
+
+        except FileNotFoundError:
+
+            self._dirty = True
 
         except Exception as e:
 
@@ -297,6 +667,8 @@ class CaseData(BaseCase):
 
     def get_case_info(self) -> dict:
 
+        self._flush_modified_time()
+
         return {
             "path": self.path,
             "created": self.created_time,
@@ -0,0 +1,84 @@
+
+import os
+
+import shutil
+
+from concurrent.futures import ThreadPoolExecutor
+
+def fast_copy(src: str, dst: str, st: os.stat_result = None) -> None:
+
+    copy_range = getattr(os, "copy_file_range", None)
+
+    if copy_range is not None:
+
+        try:
+
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+
+                if st is None:
+
+                    st = os.fstat(fsrc.fileno())
+
+                remaining = st.st_size
+
+                while remaining > 0:
+
+                    copied = copy_range(fsrc.fileno(), fdst.fileno(), remaining)
+
+                    if copied == 0:
+
+                        break
+
+                    remaining -= copied
+
+                if remaining == 0:
+
+                    os.fchmod(fdst.fileno(), st.st_mode & 0o7777)
+
+                    return
+
+        except OSError:
+
+            pass
+
+    shutil.copyfile(src, dst)
+
+    shutil.copymode(src, dst)
+
+def _collect_files(src: str, dst: str, jobs: list) -> None:
+
+    os.makedirs(dst, exist_ok=True)
+
+    with os.scandir(src) as it:
+
+        for entry in it:
+
+            target = os.path.join(dst, entry.name)
+
+            if entry.is_dir():
+
+                _collect_files(entry.path, target, jobs)
+
+            else:
+
+                jobs.append((entry.path, target, entry.stat()))
+
+def fast_copytree(src: str, dst: str) -> None:
+
+    """src 디렉터리의 내용을 dst 아래로 병렬 복사"""
+
+    jobs = []
+
+    _collect_files(str(src), str(dst), jobs)
+
+    if not jobs:
+
+        return
+
+    workers = min(32, (os.cpu_count() or 1) * 4, len(jobs))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+
+        for _ in pool.map(lambda job: fast_copy(*job), jobs):
+
+            pass
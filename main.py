@@ -1,8 +1,14 @@
 
+import os
+
 import sys
 
+import shutil
+
 import signal
 
+import time
+
 import traceback
 
 from pathlib import Path
@@ -45,6 +51,8 @@ from nextlib.utils.single_instance import SingleInstance
 
 from common.app_data import app_data
 
+from common.file_utils import fast_copytree
+
 from view.main.main_window import MainWindow
 
 from view.style.theme import apply_theme
@@ -69,6 +77,8 @@ class BipropThrustApp:
 
     def _setup_application(self) -> None:
 
+        app_data.init()
+
         from PySide6.QtCore import qInstallMessageHandler
 
         qInstallMessageHandler(qt_message_handler)
@@ -132,31 +142,17 @@ class BipropThrustApp:
 
     def _copy_basecase_to(self, target_path: Path) -> None:
 
-        import shutil
-
         project_root = Path(__file__).parent
 
-        basecase_path = project_root / "config" / "basecase"
+        basecase_path = str(project_root / "config" / "basecase")
 
-        if not basecase_path.exists():
+        if not os.path.isdir(basecase_path):
 
             return
 
         try:
 
-            for item in basecase_path.iterdir():
-
-                src = basecase_path / item.name
-
-                dst = target_path / item.name
-
-                if src.is_dir():
-
-                    shutil.copytree(src, dst, dirs_exist_ok=True)
-
-                else:
-
-                    shutil.copy2(src, dst)
+            fast_copytree(basecase_path, str(target_path))
 
         except Exception:
 
@@ -186,25 +182,31 @@ class BipropThrustApp:
 
         return self.app.exec()
 
-    def cleanup_old_temp_cases(self) -> None:
-
-        import shutil
+    def cleanup_old_temp_cases(self, days: int = 7) -> None:
 
         temp_base = Path(app_data.user_path) / "temp"
 
-        if not temp_base.exists():
-
-            return
+        cutoff = time.time() - days * 86400
 
         try:
 
-            for temp_dir in temp_base.iterdir():
+            with os.scandir(temp_base) as it:
+
+                for entry in it:
 
-                if not temp_dir.is_dir() or not temp_dir.name.startswith("temp_"):
+                    if not entry.is_dir(follow_symlinks=False) or not entry.name.startswith("temp_"):
 
-                    continue
+                        continue
 
-                shutil.rmtree(temp_dir, ignore_errors=True)
+                    if entry.stat(follow_symlinks=False).st_mtime > cutoff:
+
+                        continue
+
+                    shutil.rmtree(entry.path, ignore_errors=True)
+
+        except FileNotFoundError:
+
+            return
 
         except Exception:
 
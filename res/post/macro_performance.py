@@ -1,333 +1,221 @@
 
+# Parallel: mpirun -n K pvbatch --symmetric macro_performance.py <case>/<case>.foam
+
+import csv
+
+import hashlib
+
+import os
+
+import sys
+
+import numpy as np
+
+from paraview import servermanager
 from paraview.simple import *
 paraview.simple._DisableFirstRenderCameraReset()
 
-a5CHTFCase_noHT_reHTfoam = GetActiveSource()
-
-renderView1 = GetActiveViewOrCreate('RenderView')
-
-a5CHTFCase_noHT_reHTfoamDisplay = Show(a5CHTFCase_noHT_reHTfoam, renderView1, 'GeometryRepresentation')
-
-a5CHTFCase_noHT_reHTfoamDisplay.Representation = 'Surface'
-a5CHTFCase_noHT_reHTfoamDisplay.ColorArrayName = [None, '']
-a5CHTFCase_noHT_reHTfoamDisplay.SelectTCoordArray = 'None'
-a5CHTFCase_noHT_reHTfoamDisplay.SelectNormalArray = 'None'
-a5CHTFCase_noHT_reHTfoamDisplay.SelectTangentArray = 'None'
-a5CHTFCase_noHT_reHTfoamDisplay.OSPRayScaleArray = 'AR'
-a5CHTFCase_noHT_reHTfoamDisplay.OSPRayScaleFunction = 'PiecewiseFunction'
-a5CHTFCase_noHT_reHTfoamDisplay.SelectOrientationVectors = 'None'
-a5CHTFCase_noHT_reHTfoamDisplay.ScaleFactor = 0.0035201175371184948
-a5CHTFCase_noHT_reHTfoamDisplay.SelectScaleArray = 'AR'
-a5CHTFCase_noHT_reHTfoamDisplay.GlyphType = 'Arrow'
-a5CHTFCase_noHT_reHTfoamDisplay.GlyphTableIndexArray = 'AR'
-a5CHTFCase_noHT_reHTfoamDisplay.GaussianRadius = 0.00017600587685592472
-a5CHTFCase_noHT_reHTfoamDisplay.SetScaleArray = ['POINTS', 'AR']
-a5CHTFCase_noHT_reHTfoamDisplay.ScaleTransferFunction = 'PiecewiseFunction'
-a5CHTFCase_noHT_reHTfoamDisplay.OpacityArray = ['POINTS', 'AR']
-a5CHTFCase_noHT_reHTfoamDisplay.OpacityTransferFunction = 'PiecewiseFunction'
-a5CHTFCase_noHT_reHTfoamDisplay.DataAxesGrid = 'GridAxesRepresentation'
-a5CHTFCase_noHT_reHTfoamDisplay.PolarAxes = 'PolarAxesRepresentation'
-a5CHTFCase_noHT_reHTfoamDisplay.SelectInputVectors = ['POINTS', 'sprayMMHCloud:UTrans']
-a5CHTFCase_noHT_reHTfoamDisplay.WriteLog = ''
+if servermanager.vtkSMTrace.GetActiveTracer():
 
-a5CHTFCase_noHT_reHTfoamDisplay.ScaleTransferFunction.Points = [0.0, 0.0, 0.5, 0.0, 0.0067337192595005035, 1.0, 0.5, 0.0]
+    servermanager.vtkSMTrace.StopTrace()
 
-a5CHTFCase_noHT_reHTfoamDisplay.OpacityTransferFunction.Points = [0.0, 0.0, 0.5, 0.0, 0.0067337192595005035, 1.0, 0.5, 0.0]
+TIME = 0.02
 
-renderView1.ResetCamera(False)
+EXPRESSION = 'rho*|U|^2'
 
-materialLibrary1 = GetMaterialLibrary()
+def _time_dirs(case_dir, time):
 
-renderView1.Update()
+    bases = [case_dir]
 
-ColorBy(a5CHTFCase_noHT_reHTfoamDisplay, ('FIELD', 'vtkBlockColors'))
-
-a5CHTFCase_noHT_reHTfoamDisplay.SetScalarBarVisibility(renderView1, True)
-
-vtkBlockColorsTF2D = GetTransferFunction2D('vtkBlockColors')
-
-vtkBlockColorsLUT = GetColorTransferFunction('vtkBlockColors')
-vtkBlockColorsLUT.InterpretValuesAsCategories = 1
-vtkBlockColorsLUT.AnnotationsInitialized = 1
-vtkBlockColorsLUT.TransferFunction2D = vtkBlockColorsTF2D
-vtkBlockColorsLUT.Annotations = ['0', '0', '1', '1', '2', '2', '3', '3', '4', '4', '5', '5', '6', '6', '7', '7', '8', '8', '9', '9', '10', '10', '11', '11']
-vtkBlockColorsLUT.ActiveAnnotatedValues = ['0', '1', '6', '7']
-vtkBlockColorsLUT.IndexedColors = [1.0, 1.0, 1.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0, 1.0, 1.0, 0.63, 0.63, 1.0, 0.67, 0.5, 0.33, 1.0, 0.5, 0.75, 0.53, 0.35, 0.7, 1.0, 0.75, 0.5]
-
-vtkBlockColorsPWF = GetOpacityTransferFunction('vtkBlockColors')
-
-a5CHTFCase_noHT_reHTfoam.MeshRegions = ['/filmRegion/patch/outlet']
-
-renderView1.Update()
-
-extractSurface1 = ExtractSurface(registrationName='ExtractSurface1', Input=a5CHTFCase_noHT_reHTfoam)
-
-extractSurface1Display = Show(extractSurface1, renderView1, 'GeometryRepresentation')
-
-extractSurface1Display.Representation = 'Surface'
-extractSurface1Display.ColorArrayName = [None, '']
-extractSurface1Display.SelectTCoordArray = 'None'
-extractSurface1Display.SelectNormalArray = 'None'
-extractSurface1Display.SelectTangentArray = 'None'
-extractSurface1Display.OSPRayScaleFunction = 'PiecewiseFunction'
-extractSurface1Display.SelectOrientationVectors = 'None'
-extractSurface1Display.ScaleFactor = 0.0015060695819556714
-extractSurface1Display.SelectScaleArray = 'None'
-extractSurface1Display.GlyphType = 'Arrow'
-extractSurface1Display.GlyphTableIndexArray = 'None'
-extractSurface1Display.GaussianRadius = 7.530347909778356e-05
-extractSurface1Display.SetScaleArray = [None, '']
-extractSurface1Display.ScaleTransferFunction = 'PiecewiseFunction'
-extractSurface1Display.OpacityArray = [None, '']
-extractSurface1Display.OpacityTransferFunction = 'PiecewiseFunction'
-extractSurface1Display.DataAxesGrid = 'GridAxesRepresentation'
-extractSurface1Display.PolarAxes = 'PolarAxesRepresentation'
-extractSurface1Display.SelectInputVectors = [None, '']
-extractSurface1Display.WriteLog = ''
+    with os.scandir(case_dir) as it:
 
-Hide(a5CHTFCase_noHT_reHTfoam, renderView1)
+        bases.extend(sorted(e.path for e in it if e.name.startswith('processor') and e.is_dir()))
 
-renderView1.Update()
+    for base in bases:
 
-generateSurfaceNormals1 = GenerateSurfaceNormals(registrationName='GenerateSurfaceNormals1', Input=extractSurface1)
+        with os.scandir(base) as it:
 
-generateSurfaceNormals1.ComputeCellNormals = 1
+            for entry in sorted(it, key=lambda e: e.name):
 
-generateSurfaceNormals1Display = Show(generateSurfaceNormals1, renderView1, 'GeometryRepresentation')
+                try:
 
-generateSurfaceNormals1Display.Representation = 'Surface'
-generateSurfaceNormals1Display.ColorArrayName = [None, '']
-generateSurfaceNormals1Display.SelectTCoordArray = 'None'
-generateSurfaceNormals1Display.SelectNormalArray = 'Normals'
-generateSurfaceNormals1Display.SelectTangentArray = 'None'
-generateSurfaceNormals1Display.OSPRayScaleArray = 'Normals'
-generateSurfaceNormals1Display.OSPRayScaleFunction = 'PiecewiseFunction'
-generateSurfaceNormals1Display.SelectOrientationVectors = 'None'
-generateSurfaceNormals1Display.ScaleFactor = 0.0015060695819556714
-generateSurfaceNormals1Display.SelectScaleArray = 'None'
-generateSurfaceNormals1Display.GlyphType = 'Arrow'
-generateSurfaceNormals1Display.GlyphTableIndexArray = 'None'
-generateSurfaceNormals1Display.GaussianRadius = 7.530347909778356e-05
-generateSurfaceNormals1Display.SetScaleArray = ['POINTS', 'Normals']
-generateSurfaceNormals1Display.ScaleTransferFunction = 'PiecewiseFunction'
-generateSurfaceNormals1Display.OpacityArray = ['POINTS', 'Normals']
-generateSurfaceNormals1Display.OpacityTransferFunction = 'PiecewiseFunction'
-generateSurfaceNormals1Display.DataAxesGrid = 'GridAxesRepresentation'
-generateSurfaceNormals1Display.PolarAxes = 'PolarAxesRepresentation'
-generateSurfaceNormals1Display.SelectInputVectors = ['POINTS', 'Normals']
-generateSurfaceNormals1Display.WriteLog = ''
+                    if entry.is_dir() and float(entry.name) == time:
 
-generateSurfaceNormals1Display.ScaleTransferFunction.Points = [0.9045549035072327, 0.0, 0.5, 0.0, 0.9272884130477905, 1.0, 0.5, 0.0]
+                        yield entry.path
 
-generateSurfaceNormals1Display.OpacityTransferFunction.Points = [0.9045549035072327, 0.0, 0.5, 0.0, 0.9272884130477905, 1.0, 0.5, 0.0]
+                except ValueError:
 
-Hide(extractSurface1, renderView1)
+                    pass
 
-renderView1.Update()
+def _cache_key(case_dir, time):
 
-calculator1 = Calculator(registrationName='Calculator1', Input=generateSurfaceNormals1)
-calculator1.Function = ''
+    h = hashlib.blake2b(digest_size=16)
 
-SetActiveSource(extractSurface1)
+    h.update(os.path.realpath(case_dir).encode())
 
-calculator1.Function = ''
+    hashed = 0
 
-calculator1Display = Show(calculator1, renderView1, 'GeometryRepresentation')
+    for time_dir in _time_dirs(case_dir, time):
 
-calculator1Display.Representation = 'Surface'
-calculator1Display.ColorArrayName = [None, '']
-calculator1Display.SelectTCoordArray = 'None'
-calculator1Display.SelectNormalArray = 'Normals'
-calculator1Display.SelectTangentArray = 'None'
-calculator1Display.OSPRayScaleArray = 'Normals'
-calculator1Display.OSPRayScaleFunction = 'PiecewiseFunction'
-calculator1Display.SelectOrientationVectors = 'None'
-calculator1Display.ScaleFactor = 0.0015060695819556714
-calculator1Display.SelectScaleArray = 'None'
-calculator1Display.GlyphType = 'Arrow'
-calculator1Display.GlyphTableIndexArray = 'None'
-calculator1Display.GaussianRadius = 7.530347909778356e-05
-calculator1Display.SetScaleArray = ['POINTS', 'Normals']
-calculator1Display.ScaleTransferFunction = 'PiecewiseFunction'
-calculator1Display.OpacityArray = ['POINTS', 'Normals']
-calculator1Display.OpacityTransferFunction = 'PiecewiseFunction'
-calculator1Display.DataAxesGrid = 'GridAxesRepresentation'
-calculator1Display.PolarAxes = 'PolarAxesRepresentation'
-calculator1Display.SelectInputVectors = ['POINTS', 'Normals']
-calculator1Display.WriteLog = ''
+        for root, dirs, files in os.walk(time_dir):
 
-calculator1Display.ScaleTransferFunction.Points = [0.9045549035072327, 0.0, 0.5, 0.0, 0.9272884130477905, 1.0, 0.5, 0.0]
+            dirs.sort()
 
-calculator1Display.OpacityTransferFunction.Points = [0.9045549035072327, 0.0, 0.5, 0.0, 0.9272884130477905, 1.0, 0.5, 0.0]
+            for name in ('U', 'p', 'rho'):
 
-Hide(generateSurfaceNormals1, renderView1)
+                if name in files:
 
-renderView1.Update()
+                    path = os.path.join(root, name)
 
-SetActiveSource(a5CHTFCase_noHT_reHTfoam)
+                    h.update(f'{path}:{os.stat(path).st_mtime_ns}'.encode())
 
-a5CHTFCase_noHT_reHTfoam.MeshRegions = ['/fluid/patch/outlet']
+                    hashed += 1
 
-renderView1.Update()
+    if not hashed:
 
-SetActiveSource(calculator1)
+        return None
 
-SetActiveSource(a5CHTFCase_noHT_reHTfoam)
+    h.update(f'{time!r}:{EXPRESSION}:Result'.encode())
 
-a5CHTFCase_noHT_reHTfoam.CellArrays = ['U', 'p', 'rho']
+    return h.hexdigest()
 
-renderView1.Update()
+def _is_root():
 
-SetActiveSource(calculator1)
+    return servermanager.vtkProcessModule.GetProcessModule().GetPartitionId() == 0
 
-SetActiveSource(a5CHTFCase_noHT_reHTfoam)
+def _load_cache(cache_path, key):
 
-SetActiveSource(extractSurface1)
+    try:
 
-SetActiveSource(generateSurfaceNormals1)
+        with np.load(cache_path) as cache:
 
-SetActiveSource(calculator1)
+            if str(cache['key']) == key:
 
-SetActiveSource(generateSurfaceNormals1)
+                return cache['header'].tolist(), cache['row'].tolist()
 
-Hide(calculator1, renderView1)
+    except (OSError, KeyError, ValueError):
 
-generateSurfaceNormals1Display = Show(generateSurfaceNormals1, renderView1, 'GeometryRepresentation')
+        pass
 
-Delete(calculator1)
-del calculator1
+    return None
 
-calculator1 = Calculator(registrationName='Calculator1', Input=generateSurfaceNormals1)
-calculator1.Function = ''
+def _integrate(source, time):
 
-SetActiveSource(a5CHTFCase_noHT_reHTfoam)
+    source.MeshRegions = ['/fluid/patch/outlet']
 
-calculator1.Function = ''
+    source.CellArrays = ['U', 'p', 'rho']
 
-calculator1Display = Show(calculator1, renderView1, 'GeometryRepresentation')
+    source.Decomposepolyhedra = 0
 
-calculator1Display.Representation = 'Surface'
-calculator1Display.ColorArrayName = [None, '']
-calculator1Display.SelectTCoordArray = 'None'
-calculator1Display.SelectNormalArray = 'Normals'
-calculator1Display.SelectTangentArray = 'None'
-calculator1Display.OSPRayScaleArray = 'Normals'
-calculator1Display.OSPRayScaleFunction = 'PiecewiseFunction'
-calculator1Display.SelectOrientationVectors = 'None'
-calculator1Display.ScaleFactor = 0.0014608359429985286
-calculator1Display.SelectScaleArray = 'None'
-calculator1Display.GlyphType = 'Arrow'
-calculator1Display.GlyphTableIndexArray = 'None'
-calculator1Display.GaussianRadius = 7.304179714992643e-05
-calculator1Display.SetScaleArray = ['POINTS', 'Normals']
-calculator1Display.ScaleTransferFunction = 'PiecewiseFunction'
-calculator1Display.OpacityArray = ['POINTS', 'Normals']
-calculator1Display.OpacityTransferFunction = 'PiecewiseFunction'
-calculator1Display.DataAxesGrid = 'GridAxesRepresentation'
-calculator1Display.PolarAxes = 'PolarAxesRepresentation'
-calculator1Display.SelectInputVectors = ['POINTS', 'Normals']
-calculator1Display.WriteLog = ''
+    programmableFilter1 = ProgrammableFilter(registrationName='ProgrammableFilter1', Input=source)
+    programmableFilter1.OutputDataSetType = 'Same as Input'
+    programmableFilter1.CopyArrays = 0
+    programmableFilter1.Script = """
+from vtkmodules.numpy_interface import algorithms as algs
 
-calculator1Display.ScaleTransferFunction.Points = [0.999902069568634, 0.0, 0.5, 0.0, 1.0, 1.0, 0.5, 0.0]
+U = inputs[0].PointData['U']
 
-calculator1Display.OpacityTransferFunction.Points = [0.999902069568634, 0.0, 0.5, 0.0, 1.0, 1.0, 0.5, 0.0]
+output.PointData.append(inputs[0].PointData['rho'] * algs.dot(U, U), 'Result')
+"""
 
-Hide(generateSurfaceNormals1, renderView1)
+    timeKeeper1 = GetTimeKeeper()
 
-renderView1.Update()
+    timeKeeper1.Time = time
 
-SetActiveSource(calculator1)
+    integrateVariables1 = IntegrateVariables(registrationName='IntegrateVariables1', Input=programmableFilter1)
 
-SetActiveSource(a5CHTFCase_noHT_reHTfoam)
+    integrateVariables1.UpdatePipeline(time=time)
 
-a5CHTFCase_noHT_reHTfoam.CellArrays = ['AR', 'CH3', 'CH3NHNH2', 'CH3NN', 'CH3NNH', 'CH3NNH2', 'CH3O', 'CH4', 'CO', 'CO2', 'H', 'H2', 'H2CN', 'H2O', 'HCN', 'HNC', 'HNCO', 'HNO3', 'HONO', 'Mach', 'N', 'N2', 'N2O4', 'NH', 'NH2', 'NH3', 'NO', 'NO2', 'O', 'O2', 'OH', 'T', 'U', 'alphat', 'dQ', 'k', 'nut', 'omega', 'p', 'rho', 'sprayMMHCloud:UCoeff', 'sprayMMHCloud:UTrans', 'sprayMMHCloud:hsCoeff', 'sprayMMHCloud:hsTrans', 'sprayMMHCloud:rhoTrans_AR', 'sprayMMHCloud:rhoTrans_CH3', 'sprayMMHCloud:rhoTrans_CH3NHNH2', 'sprayMMHCloud:rhoTrans_CH3NN', 'sprayMMHCloud:rhoTrans_CH3NNH', 'sprayMMHCloud:rhoTrans_CH3NNH2', 'sprayMMHCloud:rhoTrans_CH3O', 'sprayMMHCloud:rhoTrans_CH4', 'sprayMMHCloud:rhoTrans_CO', 'sprayMMHCloud:rhoTrans_CO2', 'sprayMMHCloud:rhoTrans_H', 'sprayMMHCloud:rhoTrans_H2', 'sprayMMHCloud:rhoTrans_H2CN', 'sprayMMHCloud:rhoTrans_H2O', 'sprayMMHCloud:rhoTrans_HCN', 'sprayMMHCloud:rhoTrans_HNC', 'sprayMMHCloud:rhoTrans_HNCO', 'sprayMMHCloud:rhoTrans_HNO3', 'sprayMMHCloud:rhoTrans_HONO', 'sprayMMHCloud:rhoTrans_N', 'sprayMMHCloud:rhoTrans_N2', 'sprayMMHCloud:rhoTrans_N2O4', 'sprayMMHCloud:rhoTrans_NH', 'sprayMMHCloud:rhoTrans_NH2', 'sprayMMHCloud:rhoTrans_NH3', 'sprayMMHCloud:rhoTrans_NO', 'sprayMMHCloud:rhoTrans_NO2', 'sprayMMHCloud:rhoTrans_O', 'sprayMMHCloud:rhoTrans_O2', 'sprayMMHCloud:rhoTrans_OH', 'sprayNTOCloud:UCoeff', 'sprayNTOCloud:UTrans', 'sprayNTOCloud:hsCoeff', 'sprayNTOCloud:hsTrans', 'sprayNTOCloud:rhoTrans_AR', 'sprayNTOCloud:rhoTrans_CH3', 'sprayNTOCloud:rhoTrans_CH3NHNH2', 'sprayNTOCloud:rhoTrans_CH3NN', 'sprayNTOCloud:rhoTrans_CH3NNH', 'sprayNTOCloud:rhoTrans_CH3NNH2', 'sprayNTOCloud:rhoTrans_CH3O', 'sprayNTOCloud:rhoTrans_CH4', 'sprayNTOCloud:rhoTrans_CO', 'sprayNTOCloud:rhoTrans_CO2', 'sprayNTOCloud:rhoTrans_H', 'sprayNTOCloud:rhoTrans_H2', 'sprayNTOCloud:rhoTrans_H2CN', 'sprayNTOCloud:rhoTrans_H2O', 'sprayNTOCloud:rhoTrans_HCN', 'sprayNTOCloud:rhoTrans_HNC', 'sprayNTOCloud:rhoTrans_HNCO', 'sprayNTOCloud:rhoTrans_HNO3', 'sprayNTOCloud:rhoTrans_HONO', 'sprayNTOCloud:rhoTrans_N', 'sprayNTOCloud:rhoTrans_N2', 'sprayNTOCloud:rhoTrans_N2O4', 'sprayNTOCloud:rhoTrans_NH', 'sprayNTOCloud:rhoTrans_NH2', 'sprayNTOCloud:rhoTrans_NH3', 'sprayNTOCloud:rhoTrans_NO', 'sprayNTOCloud:rhoTrans_NO2', 'sprayNTOCloud:rhoTrans_O', 'sprayNTOCloud:rhoTrans_O2', 'sprayNTOCloud:rhoTrans_OH']
+    output = servermanager.Fetch(integrateVariables1, idx=0)
 
-renderView1.Update()
+    point_data = output.GetPointData()
 
-SetActiveSource(calculator1)
+    header = []
 
-SetActiveSource(a5CHTFCase_noHT_reHTfoam)
+    row = []
 
-SetActiveSource(extractSurface1)
+    for i in range(point_data.GetNumberOfArrays()):
 
-SetActiveSource(generateSurfaceNormals1)
+        array = point_data.GetArray(i)
 
-SetActiveSource(calculator1)
+        name = array.GetName()
 
-animationScene1 = GetAnimationScene()
+        ncomp = array.GetNumberOfComponents()
 
-animationScene1.AnimationTime = 0.02
+        if ncomp == 1:
 
-timeKeeper1 = GetTimeKeeper()
+            header.append(name)
 
-SetActiveSource(generateSurfaceNormals1)
+        else:
 
-SetActiveSource(calculator1)
+            header.extend(f"{name}_{'XYZ'[c] if ncomp == 3 else c}" for c in range(ncomp))
 
-SetActiveSource(a5CHTFCase_noHT_reHTfoam)
+        row.extend(array.GetComponent(0, c) for c in range(ncomp))
 
-a5CHTFCase_noHT_reHTfoam.CellArrays = ['U', 'p', 'rho']
+    return header, row
 
-renderView1.Update()
+def _open_case(case_file):
 
-SetActiveSource(calculator1)
+    source = GetActiveSource()
 
-calculator1.Function = 'rho*(U_X*U_X+U_Y*U_Y+U_Z*U_Z)'
+    if source is not None:
 
-renderView1.Update()
+        return source
 
-integrateVariables1 = IntegrateVariables(registrationName='IntegrateVariables1', Input=calculator1)
-print(integrateVariables1)
+    if not case_file:
 
-spreadSheetView1 = CreateView('SpreadSheetView')
-spreadSheetView1.ColumnToSort = ''
-spreadSheetView1.BlockSize = 1024
+        raise ValueError('No active source; pass the .foam case file')
 
-integrateVariables1Display = Show(integrateVariables1, spreadSheetView1, 'SpreadSheetRepresentation')
+    case_dir = os.path.dirname(os.path.abspath(case_file))
 
-layout1 = GetLayoutByName("Layout #1")
+    decomposed = any(name.startswith('processor') for name in os.listdir(case_dir))
 
-AssignViewToLayout(view=spreadSheetView1, layout=layout1, hint=0)
+    return OpenFOAMReader(
+        registrationName=os.path.basename(case_file),
+        FileName=case_file,
+        CaseType='Decomposed Case' if decomposed else 'Reconstructed Case',
+    )
 
-integrateVariables1Display.Assembly = ''
+def run_macro(out_csv=None, time=TIME, case_file=None):
 
-renderView1.Update()
+    a5CHTFCase_noHT_reHTfoam = _open_case(case_file)
 
-spreadSheetView1.Update()
+    case_dir = os.path.dirname(os.path.abspath(a5CHTFCase_noHT_reHTfoam.FileName))
 
-SelectIDs(IDs=[-1, 0], FieldType=1, ContainingCells=0)
+    out_csv = out_csv or os.path.join(case_dir, 'performance_thrust.csv')
 
-SetActiveSource(integrateVariables1)
+    cache_path = os.path.splitext(out_csv)[0] + '.npz'
 
-SelectIDs(IDs=[-1, 0], FieldType=1, ContainingCells=0)
+    key = _cache_key(case_dir, time)
 
-SelectIDs(IDs=[-1, 0], FieldType=1, ContainingCells=0)
+    cached = _load_cache(cache_path, key) if key else None
 
-SelectIDs(IDs=[-1, 0], FieldType=1, ContainingCells=0)
+    if cached:
 
-SelectIDs(IDs=[-1, 0], FieldType=1, ContainingCells=0)
+        header, row = cached
 
-SelectIDs(IDs=[-1, 0], FieldType=1, ContainingCells=0)
+    else:
 
-SelectIDs(IDs=[-1, 0], FieldType=1, ContainingCells=0)
+        header, row = _integrate(a5CHTFCase_noHT_reHTfoam, time)
 
-SelectIDs(IDs=[-1, 0], FieldType=1, ContainingCells=0)
+        if key and _is_root():
 
-SelectIDs(IDs=[-1, 0], FieldType=1, ContainingCells=0)
+            np.savez(cache_path, key=key, header=np.array(header), row=np.array(row, dtype=np.float64))
 
-SelectIDs(IDs=[-1, 0], FieldType=1, ContainingCells=0)
+    if not _is_root():
 
-SelectIDs(IDs=[-1, 0], FieldType=1, ContainingCells=0)
+        return out_csv
 
-ExportView('/home/user1/OpenFOAM/user1-v2212/run/jskang/KARI/250214/CHTF/5.CHTFCase_noHT_reHT/performance_thrust.csv', view=spreadSheetView1, RealNumberNotation='Scientific')
+    with open(out_csv, 'w', newline='') as f:
 
+        writer = csv.writer(f)
 
+        writer.writerow(header)
 
-layout1.SetSize(1280, 1157)
+        writer.writerow([f'{v:.17e}' for v in row])
 
+    return out_csv
 
-renderView1.CameraPosition = [-0.04490822510305423, 0.03471043690336882, 0.04260718620139332]
-renderView1.CameraFocalPoint = [0.01640058762859553, 3.0035153031348547e-07, 0.0]
-renderView1.CameraViewUp = [0.30397586969568235, 0.9044152502802929, -0.2993855803194079]
-renderView1.CameraParallelScale = 0.021309684052540755
+if __name__ == '__main__':
 
+    run_macro(case_file=sys.argv[1] if len(sys.argv) > 1 else None)
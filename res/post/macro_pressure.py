@@ -1,10 +1,40 @@
 
+# Parallel: mpirun -np N pvbatch macro_pressure.py <case>/<case>.foam
+
+import os
+
+import sys
+
 from paraview.simple import *
 paraview.simple._DisableFirstRenderCameraReset()
 
 a5CHTFCase_noHT_reHTfoam = GetActiveSource()
 
-a5CHTFCase_noHT_reHTfoam.CaseType = 'Decomposed Case'
+if a5CHTFCase_noHT_reHTfoam is None:
+
+    a5CHTFCase_noHT_reHTfoam = OpenFOAMReader(registrationName=os.path.basename(sys.argv[1]), FileName=sys.argv[1])
+
+case_dir = os.path.dirname(os.path.abspath(a5CHTFCase_noHT_reHTfoam.FileName))
+
+if any(name.startswith('processor') for name in os.listdir(case_dir)):
+
+    a5CHTFCase_noHT_reHTfoam.CaseType = 'Decomposed Case'
+
+else:
+
+    a5CHTFCase_noHT_reHTfoam.CaseType = 'Reconstructed Case'
+
+a5CHTFCase_noHT_reHTfoam.MeshRegions = ['/fluid/internalMesh', '/fluid/lagrangian/sprayMMHCloud', '/fluid/lagrangian/sprayMMHCloudTracks', '/fluid/lagrangian/sprayNTOCloud', '/fluid/lagrangian/sprayNTOCloudTracks']
+
+a5CHTFCase_noHT_reHTfoam.CellArrays = ['p']
+
+a5CHTFCase_noHT_reHTfoam.LagrangianArrays = ['d']
+
+timeKeeper1 = GetTimeKeeper()
+
+timeKeeper1.Time = 0.02
+
+a5CHTFCase_noHT_reHTfoam.UpdatePipeline(time=0.02)
 
 renderView1 = GetActiveViewOrCreate('RenderView')
 
@@ -35,27 +65,14 @@ renderView1.ResetCamera(False)
 
 materialLibrary1 = GetMaterialLibrary()
 
-animationScene1 = GetAnimationScene()
-
-timeKeeper1 = GetTimeKeeper()
-
-animationScene1.UpdateAnimationUsingDataTimeSteps()
-
-renderView1.Update()
-
-a5CHTFCase_noHT_reHTfoam.CaseType = 'Reconstructed Case'
-
-animationScene1.UpdateAnimationUsingDataTimeSteps()
-
-renderView1.Update()
-
 renderView1.ResetActiveCameraToNegativeZ()
 
 renderView1.ResetCamera(False)
 
-animationScene1.AnimationTime = 0.02
+extractFluid = ExtractBlock(registrationName='ExtractFluid', Input=a5CHTFCase_noHT_reHTfoam)
+extractFluid.Selectors = ['/Root/fluid/internalMesh']
 
-slice1 = Slice(registrationName='Slice1', Input=a5CHTFCase_noHT_reHTfoam)
+slice1 = Slice(registrationName='Slice1', Input=extractFluid)
 slice1.SliceType = 'Plane'
 slice1.HyperTreeGridSlicer = 'Plane'
 slice1.SliceOffsetValues = [0.0]
@@ -95,7 +112,7 @@ slice1Display.OpacityArray = ['POINTS', 'p']
 slice1Display.OpacityTransferFunction = 'PiecewiseFunction'
 slice1Display.DataAxesGrid = 'GridAxesRepresentation'
 slice1Display.PolarAxes = 'PolarAxesRepresentation'
-slice1Display.SelectInputVectors = ['POINTS', 'U']
+slice1Display.SelectInputVectors = [None, '']
 slice1Display.WriteLog = ''
 
 slice1Display.ScaleTransferFunction.Points = [2049.45263671875, 0.0, 0.5, 0.0, 972346.0, 1.0, 0.5, 0.0]
@@ -106,76 +123,42 @@ Hide(a5CHTFCase_noHT_reHTfoam, renderView1)
 
 slice1Display.SetScalarBarVisibility(renderView1, True)
 
-renderView1.Update()
-
 pPWF = GetOpacityTransferFunction('p')
 pPWF.Points = [2049.45263671875, 0.0, 0.5, 0.0, 972346.0, 1.0, 0.5, 0.0]
 pPWF.ScalarRangeInitialized = 1
 
 HideInteractiveWidgets(proxy=slice1.SliceType)
 
-a5CHTFCase_noHT_reHTfoam_1 = OpenFOAMReader(registrationName='5.CHTFCase_noHT_reHT.foam', FileName='/home/user1/OpenFOAM/user1-v2212/run/jskang/KARI/250214/CHTF/5.CHTFCase_noHT_reHT/5.CHTFCase_noHT_reHT.foam')
-a5CHTFCase_noHT_reHTfoam_1.MeshRegions = ['/filmRegion/internalMesh', '/fluid/internalMesh', '/fluid/lagrangian/sprayMMHCloudTracks', '/fluid/lagrangian/sprayNTOCloudTracks', '/fluid/lagrangian/sprayMMHCloud', '/fluid/lagrangian/sprayNTOCloud', '/header/internalMesh', '/thruster/internalMesh']
-a5CHTFCase_noHT_reHTfoam_1.CellArrays = ['AR', 'CH3', 'CH3NHNH2', 'CH3NN', 'CH3NNH', 'CH3NNH2', 'CH3O', 'CH4', 'CO', 'CO2', 'H', 'H2', 'H2CN', 'H2O', 'HCN', 'HNC', 'HNCO', 'HNO3', 'HONO', 'Mach', 'N', 'N2', 'N2O4', 'NH', 'NH2', 'NH3', 'NO', 'NO2', 'O', 'O2', 'OH', 'T', 'U', 'alphat', 'dQ', 'k', 'nut', 'omega', 'p', 'rho', 'sprayMMHCloud:UCoeff', 'sprayMMHCloud:UTrans', 'sprayMMHCloud:hsCoeff', 'sprayMMHCloud:hsTrans', 'sprayMMHCloud:rhoTrans_AR', 'sprayMMHCloud:rhoTrans_CH3', 'sprayMMHCloud:rhoTrans_CH3NHNH2', 'sprayMMHCloud:rhoTrans_CH3NN', 'sprayMMHCloud:rhoTrans_CH3NNH', 'sprayMMHCloud:rhoTrans_CH3NNH2', 'sprayMMHCloud:rhoTrans_CH3O', 'sprayMMHCloud:rhoTrans_CH4', 'sprayMMHCloud:rhoTrans_CO', 'sprayMMHCloud:rhoTrans_CO2', 'sprayMMHCloud:rhoTrans_H', 'sprayMMHCloud:rhoTrans_H2', 'sprayMMHCloud:rhoTrans_H2CN', 'sprayMMHCloud:rhoTrans_H2O', 'sprayMMHCloud:rhoTrans_HCN', 'sprayMMHCloud:rhoTrans_HNC', 'sprayMMHCloud:rhoTrans_HNCO', 'sprayMMHCloud:rhoTrans_HNO3', 'sprayMMHCloud:rhoTrans_HONO', 'sprayMMHCloud:rhoTrans_N', 'sprayMMHCloud:rhoTrans_N2', 'sprayMMHCloud:rhoTrans_N2O4', 'sprayMMHCloud:rhoTrans_NH', 'sprayMMHCloud:rhoTrans_NH2', 'sprayMMHCloud:rhoTrans_NH3', 'sprayMMHCloud:rhoTrans_NO', 'sprayMMHCloud:rhoTrans_NO2', 'sprayMMHCloud:rhoTrans_O', 'sprayMMHCloud:rhoTrans_O2', 'sprayMMHCloud:rhoTrans_OH', 'sprayNTOCloud:UCoeff', 'sprayNTOCloud:UTrans', 'sprayNTOCloud:hsCoeff', 'sprayNTOCloud:hsTrans', 'sprayNTOCloud:rhoTrans_AR', 'sprayNTOCloud:rhoTrans_CH3', 'sprayNTOCloud:rhoTrans_CH3NHNH2', 'sprayNTOCloud:rhoTrans_CH3NN', 'sprayNTOCloud:rhoTrans_CH3NNH', 'sprayNTOCloud:rhoTrans_CH3NNH2', 'sprayNTOCloud:rhoTrans_CH3O', 'sprayNTOCloud:rhoTrans_CH4', 'sprayNTOCloud:rhoTrans_CO', 'sprayNTOCloud:rhoTrans_CO2', 'sprayNTOCloud:rhoTrans_H', 'sprayNTOCloud:rhoTrans_H2', 'sprayNTOCloud:rhoTrans_H2CN', 'sprayNTOCloud:rhoTrans_H2O', 'sprayNTOCloud:rhoTrans_HCN', 'sprayNTOCloud:rhoTrans_HNC', 'sprayNTOCloud:rhoTrans_HNCO', 'sprayNTOCloud:rhoTrans_HNO3', 'sprayNTOCloud:rhoTrans_HONO', 'sprayNTOCloud:rhoTrans_N', 'sprayNTOCloud:rhoTrans_N2', 'sprayNTOCloud:rhoTrans_N2O4', 'sprayNTOCloud:rhoTrans_NH', 'sprayNTOCloud:rhoTrans_NH2', 'sprayNTOCloud:rhoTrans_NH3', 'sprayNTOCloud:rhoTrans_NO', 'sprayNTOCloud:rhoTrans_NO2', 'sprayNTOCloud:rhoTrans_O', 'sprayNTOCloud:rhoTrans_O2', 'sprayNTOCloud:rhoTrans_OH']
-a5CHTFCase_noHT_reHTfoam_1.LagrangianArrays = ['Cp', 'KHindex', 'Nu', 'Re', 'T', 'Tfg', 'U', 'UCorrect', 'UTurb', 'We', 'YCH3NHNH2(l)', 'YN2O4(l)', 'active', 'age', 'd', 'd0', 'dTarget', 'htc', 'injector', 'liquidCore', 'mass0', 'ms', 'mu', 'nParticle', 'origId', 'origProcId', 'position0', 'rho', 'sigma', 'tMom', 'tTurb', 'tc', 'typeId', 'user', 'y', 'yDot']
-
-a5CHTFCase_noHT_reHTfoam_1.MeshRegions = ['/fluid/lagrangian/sprayMMHCloud', '/fluid/lagrangian/sprayMMHCloudTracks', '/fluid/lagrangian/sprayNTOCloud', '/fluid/lagrangian/sprayNTOCloudTracks']
-
-a5CHTFCase_noHT_reHTfoam_1Display = Show(a5CHTFCase_noHT_reHTfoam_1, renderView1, 'GeometryRepresentation')
-
-a5CHTFCase_noHT_reHTfoam_1Display.Representation = 'Surface'
-a5CHTFCase_noHT_reHTfoam_1Display.ColorArrayName = [None, '']
-a5CHTFCase_noHT_reHTfoam_1Display.SelectTCoordArray = 'None'
-a5CHTFCase_noHT_reHTfoam_1Display.SelectNormalArray = 'None'
-a5CHTFCase_noHT_reHTfoam_1Display.SelectTangentArray = 'None'
-a5CHTFCase_noHT_reHTfoam_1Display.OSPRayScaleArray = 'Cp'
-a5CHTFCase_noHT_reHTfoam_1Display.OSPRayScaleFunction = 'PiecewiseFunction'
-a5CHTFCase_noHT_reHTfoam_1Display.SelectOrientationVectors = 'U'
-a5CHTFCase_noHT_reHTfoam_1Display.ScaleFactor = 0.0006851332494989038
-a5CHTFCase_noHT_reHTfoam_1Display.SelectScaleArray = 'Cp'
-a5CHTFCase_noHT_reHTfoam_1Display.GlyphType = 'Arrow'
-a5CHTFCase_noHT_reHTfoam_1Display.GlyphTableIndexArray = 'Cp'
-a5CHTFCase_noHT_reHTfoam_1Display.GaussianRadius = 3.4256662474945186e-05
-a5CHTFCase_noHT_reHTfoam_1Display.SetScaleArray = ['POINTS', 'Cp']
-a5CHTFCase_noHT_reHTfoam_1Display.ScaleTransferFunction = 'PiecewiseFunction'
-a5CHTFCase_noHT_reHTfoam_1Display.OpacityArray = ['POINTS', 'Cp']
-a5CHTFCase_noHT_reHTfoam_1Display.OpacityTransferFunction = 'PiecewiseFunction'
-a5CHTFCase_noHT_reHTfoam_1Display.DataAxesGrid = 'GridAxesRepresentation'
-a5CHTFCase_noHT_reHTfoam_1Display.PolarAxes = 'PolarAxesRepresentation'
-a5CHTFCase_noHT_reHTfoam_1Display.SelectInputVectors = ['POINTS', 'U']
-a5CHTFCase_noHT_reHTfoam_1Display.WriteLog = ''
-
-a5CHTFCase_noHT_reHTfoam_1Display.ScaleTransferFunction.Points = [1588.0628662109375, 0.0, 0.5, 0.0, 3925.705322265625, 1.0, 0.5, 0.0]
-
-a5CHTFCase_noHT_reHTfoam_1Display.OpacityTransferFunction.Points = [1588.0628662109375, 0.0, 0.5, 0.0, 3925.705322265625, 1.0, 0.5, 0.0]
-
-renderView1.Update()
-
-ColorBy(a5CHTFCase_noHT_reHTfoam_1Display, ('FIELD', 'vtkBlockColors'))
-
-a5CHTFCase_noHT_reHTfoam_1Display.SetScalarBarVisibility(renderView1, True)
-
-vtkBlockColorsTF2D = GetTransferFunction2D('vtkBlockColors')
-
-vtkBlockColorsLUT = GetColorTransferFunction('vtkBlockColors')
-vtkBlockColorsLUT.InterpretValuesAsCategories = 1
-vtkBlockColorsLUT.AnnotationsInitialized = 1
-vtkBlockColorsLUT.TransferFunction2D = vtkBlockColorsTF2D
-vtkBlockColorsLUT.Annotations = ['0', '0', '1', '1', '2', '2', '3', '3', '4', '4', '5', '5', '6', '6', '7', '7', '8', '8', '9', '9', '10', '10', '11', '11']
-vtkBlockColorsLUT.ActiveAnnotatedValues = ['0', '1', '2', '3']
-vtkBlockColorsLUT.IndexedColors = [1.0, 1.0, 1.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0, 1.0, 1.0, 0.63, 0.63, 1.0, 0.67, 0.5, 0.33, 1.0, 0.5, 0.75, 0.53, 0.35, 0.7, 1.0, 0.75, 0.5]
-
-vtkBlockColorsPWF = GetOpacityTransferFunction('vtkBlockColors')
-
-a5CHTFCase_noHT_reHTfoam_1Display.SetRepresentationType('Points')
-
-ColorBy(a5CHTFCase_noHT_reHTfoam_1Display, ('CELLS', 'd'))
-
-HideScalarBarIfNotNeeded(vtkBlockColorsLUT, renderView1)
-
-a5CHTFCase_noHT_reHTfoam_1Display.RescaleTransferFunctionToDataRange(True, False)
-
-a5CHTFCase_noHT_reHTfoam_1Display.SetScalarBarVisibility(renderView1, True)
+extractSpray = ExtractBlock(registrationName='ExtractSpray', Input=a5CHTFCase_noHT_reHTfoam)
+extractSpray.Selectors = ['/Root/fluid/lagrangian/sprayMMHCloud', '/Root/fluid/lagrangian/sprayMMHCloudTracks', '/Root/fluid/lagrangian/sprayNTOCloud', '/Root/fluid/lagrangian/sprayNTOCloudTracks']
+
+extractSprayDisplay = Show(extractSpray, renderView1, 'GeometryRepresentation')
+
+extractSprayDisplay.Representation = 'Points'
+extractSprayDisplay.ColorArrayName = [None, '']
+extractSprayDisplay.SelectTCoordArray = 'None'
+extractSprayDisplay.SelectNormalArray = 'None'
+extractSprayDisplay.SelectTangentArray = 'None'
+extractSprayDisplay.OSPRayScaleArray = 'd'
+extractSprayDisplay.OSPRayScaleFunction = 'PiecewiseFunction'
+extractSprayDisplay.SelectOrientationVectors = 'None'
+extractSprayDisplay.ScaleFactor = 0.0006851332494989038
+extractSprayDisplay.SelectScaleArray = 'd'
+extractSprayDisplay.GlyphType = 'Arrow'
+extractSprayDisplay.GlyphTableIndexArray = 'd'
+extractSprayDisplay.GaussianRadius = 3.4256662474945186e-05
+extractSprayDisplay.SetScaleArray = ['POINTS', 'd']
+extractSprayDisplay.ScaleTransferFunction = 'PiecewiseFunction'
+extractSprayDisplay.OpacityArray = ['POINTS', 'd']
+extractSprayDisplay.OpacityTransferFunction = 'PiecewiseFunction'
+extractSprayDisplay.DataAxesGrid = 'GridAxesRepresentation'
+extractSprayDisplay.PolarAxes = 'PolarAxesRepresentation'
+extractSprayDisplay.SelectInputVectors = [None, '']
+extractSprayDisplay.WriteLog = ''
+
+extractSprayDisplay.ScaleTransferFunction.Points = [5.082769121145247e-07, 0.0, 0.5, 0.0, 3.3203279599547386e-05, 1.0, 0.5, 0.0]
+
+extractSprayDisplay.OpacityTransferFunction.Points = [5.082769121145247e-07, 0.0, 0.5, 0.0, 3.3203279599547386e-05, 1.0, 0.5, 0.0]
 
 dTF2D = GetTransferFunction2D('d')
 
@@ -188,6 +171,10 @@ dPWF = GetOpacityTransferFunction('d')
 dPWF.Points = [5.082769121145247e-07, 0.0, 0.5, 0.0, 3.3203279599547386e-05, 1.0, 0.5, 0.0]
 dPWF.ScalarRangeInitialized = 1
 
+ColorBy(extractSprayDisplay, ('CELLS', 'd'))
+
+extractSprayDisplay.SetScalarBarVisibility(renderView1, True)
+
 dLUTColorBar = GetScalarBar(dLUT, renderView1)
 dLUTColorBar.WindowLocation = 'Upper Right Corner'
 dLUTColorBar.Title = 'd'
@@ -210,6 +197,7 @@ pLUTColorBar.ScalarBarLength = 0.32999999999999974
 pLUTColorBar.Position = [0.25842671194114336, 0.7022990492653416]
 pLUTColorBar.ScalarBarLength = 0.32999999999999957
 
+renderView1.Update()
 
 layout1 = GetLayout()
 
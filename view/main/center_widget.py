@@ -1,9 +1,11 @@
 
-from pathlib import Path
+import os
 
-from PySide6.QtWidgets import QWidget, QGroupBox, QTreeWidget
+from enum import IntEnum
 
-from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QWidget, QGroupBox, QTreeWidget, QTreeWidgetItem
+
+from PySide6.QtCore import Qt, Slot, QTimer
 
 from common.app_context import AppContext
 
@@ -19,8 +21,58 @@ from view.panel.run_view import RunView
 
 from view.panel.post_view import PostView
 
+class TreeTag(IntEnum):
+
+    GEOMETRY = 1
+
+    MESH_GENERATION = 2
+
+    RUN = 3
+
+    MODELS = 4
+
+    INITIAL_CONDITIONS = 5
+
+    SPRAY_MMH = 6
+
+    SPRAY_NTO = 7
+
+    NUMERICAL_CONDITIONS = 8
+
+    RUN_CONDITIONS = 9
+
+    RESIDUAL = 10
+
+    POST = 11
+
 class CenterWidget(QWidget):
 
+    _TREE_TAGS = {
+        (None, "Geometry"): TreeTag.GEOMETRY,
+        (None, "Mesh Generation"): TreeTag.MESH_GENERATION,
+        (None, "Run"): TreeTag.RUN,
+        ("Setup", "Models"): TreeTag.MODELS,
+        ("Setup", "Initial Conditions"): TreeTag.INITIAL_CONDITIONS,
+        ("Setup", "Spray - MMH"): TreeTag.SPRAY_MMH,
+        ("Setup", "Spray - NTO"): TreeTag.SPRAY_NTO,
+        ("Solution", "Numerical Conditions"): TreeTag.NUMERICAL_CONDITIONS,
+        ("Solution", "Run Conditions"): TreeTag.RUN_CONDITIONS,
+        ("Results", "Residual"): TreeTag.RESIDUAL,
+        ("Results", "Post"): TreeTag.POST,
+    }
+
+    _PAGE_NAMES = {
+        TreeTag.GEOMETRY: "page_geometry",
+        TreeTag.MESH_GENERATION: "page_mesh_generation",
+        TreeTag.RUN: "page_run",
+        TreeTag.MODELS: "page_models",
+        TreeTag.INITIAL_CONDITIONS: "page_initial_conditions",
+        TreeTag.SPRAY_MMH: "page_mmh",
+        TreeTag.SPRAY_NTO: "page_nto",
+        TreeTag.NUMERICAL_CONDITIONS: "page_numerical_conditions",
+        TreeTag.RUN_CONDITIONS: "page_run_conditions",
+    }
+
     def __init__(self, parent=None, context: AppContext = None):
 
         super().__init__(parent)
@@ -47,8 +99,38 @@ class CenterWidget(QWidget):
 
         self.panel_views = {}
 
+        self._render_window = None
+
+        self._renderer = None
+
+        self._last_tag = None
+
+        self._residual_log_key = None
+
+        self._residual_log_file = None
+
         self._setup_panels()
 
+        self._slice_widgets = {
+            key: getattr(self.panel_views.get(key), "slice_widget", None)
+            for key in ("geometry", "mesh")
+        }
+
+        self._tag_tree_items()
+
+        self._page_by_tag = {
+            tag: getattr(self.ui, name) for tag, name in self._PAGE_NAMES.items()
+        }
+
+        self._set_page = self.ui.stackedWidget.setCurrentWidget
+
+        self._change_dock = self.dock_manager.change_dock_tab if self.dock_manager else None
+
+        self._results_actions = {
+            TreeTag.RESIDUAL: (4, self._schedule_residual_log),
+            TreeTag.POST: (3, self._load_post_results),
+        }
+
         self._connect_signals()
 
     def _setup_panels(self) -> None:
@@ -61,15 +143,37 @@ class CenterWidget(QWidget):
 
         self.panel_views["post"] = PostView(self)
 
-    def _clear_designer_styles(self) -> None:
+        self._mesh_view = self.panel_views["mesh"]
+
+    def _tag_tree_items(self) -> None:
+
+        tree = self.ui.treeWidget
+
+        for i in range(tree.topLevelItemCount()):
+
+            top = tree.topLevelItem(i)
 
-        for tree in self.findChildren(QTreeWidget):
+            self._tag_tree_item(top, None)
 
-            tree.setStyleSheet("")
+            for j in range(top.childCount()):
 
-        for gb in self.findChildren(QGroupBox):
+                self._tag_tree_item(top.child(j), top.text(0))
+
+    def _tag_tree_item(self, item: QTreeWidgetItem, parent_text) -> None:
+
+        tag = self._TREE_TAGS.get((parent_text, item.text(0)))
+
+        if tag:
+
+            item.setData(0, Qt.UserRole, int(tag))
+
+    def _clear_designer_styles(self) -> None:
 
-            gb.setStyleSheet("")
+        for w in self.findChildren(QWidget):
+
+            if isinstance(w, (QTreeWidget, QGroupBox)) and w.styleSheet():
+
+                w.setStyleSheet("")
 
     def _connect_signals(self) -> None:
 
@@ -85,7 +189,9 @@ class CenterWidget(QWidget):
 
             self.ui.treeWidget.setCurrentItem(geometry_item)
 
-    def _on_tree_item_clicked(self, item, column) -> None:
+    @Slot(QTreeWidgetItem, int)
+
+    def _on_tree_item_clicked(self, item: QTreeWidgetItem, column: int) -> None:
 
         if item.childCount() > 0:
 
@@ -93,11 +199,23 @@ class CenterWidget(QWidget):
 
             first_child = item.child(0)
 
+            self.ui.treeWidget.blockSignals(True)
+
             self.ui.treeWidget.setCurrentItem(first_child)
 
+            self.ui.treeWidget.blockSignals(False)
+
+            self._on_tree_selection_changed()
+
+    @Slot()
+
     def _on_tree_selection_changed(self) -> None:
 
-        selected_items = self.ui.treeWidget.selectedItems()
+        tree = self.ui.treeWidget
+
+        vtk_pre = self.vtk_pre
+
+        selected_items = tree.selectedItems()
 
         if not selected_items:
 
@@ -107,309 +225,257 @@ class CenterWidget(QWidget):
 
         if item.childCount() > 0:
 
-            self.ui.treeWidget.expandItem(item)
+            tree.expandItem(item)
 
             return
 
-        item_text = item.text(0)
-
-        parent = item.parent()
+        tag = item.data(0, Qt.UserRole)
 
-        parent_text = parent.text(0) if parent else None
+        if tag == self._last_tag:
 
-        page_map = {
-            "Geometry": self.ui.page_geometry,
-            "Mesh Generation": self.ui.page_mesh_generation,
-            "Run": self.ui.page_run,
-        }
-
-        setup_pages = {
-            "Models": self.ui.page_models,
-            "Initial Conditions": self.ui.page_initial_conditions,
-            "Spray - MMH": self.ui.page_mmh,
-            "Spray - NTO": self.ui.page_nto,
-        }
-
-        solution_pages = {
-            "Numerical Conditions": self.ui.page_numerical_conditions,
-            "Run Conditions": self.ui.page_run_conditions,
-        }
-
-        page = None
-
-        if parent_text:
-
-            if parent_text == "Setup":
-
-                page = setup_pages.get(item_text)
-
-            elif parent_text == "Solution":
-
-                page = solution_pages.get(item_text)
-
-            elif parent_text == "Results":
+            return
 
-                if item_text == "Residual":
+        self._last_tag = tag
 
-                    if self.dock_manager:
+        action = self._results_actions.get(tag)
 
-                        self.dock_manager.change_dock_tab(4)
+        if action:
 
-                    self._load_residual_log()
+            tab, load = action
 
-                elif item_text == "Post":
+            if self._change_dock:
 
-                    if self.dock_manager:
+                self._change_dock(tab)
 
-                        self.dock_manager.change_dock_tab(3)
+            load()
 
-                    post_view = self.panel_views.get("post")
+            if vtk_pre:
 
-                    if post_view and not getattr(post_view, '_results_loaded', False):
+                self._show_mesh_objects(render=False)
 
-                        post_view.load_results()
+                self._show_slice_toolbar("mesh")
 
-                if self.vtk_pre:
+                vtk_pre.set_visibility_mode("mesh")
 
-                    self._show_mesh_objects()
+                self._set_probe_markers_visible(False)
 
-                    self._show_slice_toolbar("mesh")
+                self._render()
 
-                    self.vtk_pre.set_visibility_mode("mesh")
+            return
 
-                    geo_view = self.panel_views.get("geometry")
+        page = self._page_by_tag.get(tag)
 
-                    if geo_view and hasattr(geo_view, '_probe_marker_actors') and geo_view._probe_marker_actors:
+        if page:
 
-                        for _m in geo_view._probe_marker_actors:
+            self._set_page(page)
 
-                            _m.SetVisibility(False)
+            if vtk_pre:
 
-                        self.vtk_pre.vtk_widget.GetRenderWindow().Render()
+                if tag == TreeTag.GEOMETRY:
 
-                return
+                    self._show_geometry_objects(render=False)
 
-        else:
+                    self._show_slice_toolbar("geometry")
 
-            page = page_map.get(item_text)
+                    vtk_pre.set_visibility_mode("geometry")
 
-        if page:
+                    self._set_probe_markers_visible(True)
 
-            self.ui.stackedWidget.setCurrentWidget(page)
+                else:
 
-            from PySide6.QtWidgets import QApplication
+                    self._show_mesh_objects(render=False)
 
-            QApplication.processEvents()
+                    self._show_slice_toolbar("mesh")
 
-            if self.vtk_pre:
+                    vtk_pre.set_visibility_mode("mesh")
 
-                if item_text == "Geometry" and not parent_text:
+                    self._set_probe_markers_visible(False)
 
-                    self._show_geometry_objects()
+                self._render()
 
-                    self._show_slice_toolbar("geometry")
+    def _set_probe_markers_visible(self, visible: bool) -> None:
 
-                    self.vtk_pre.set_visibility_mode("geometry")
+        geo_view = self.panel_views.get("geometry")
 
-                    geo_view = self.panel_views.get("geometry")
+        markers = getattr(geo_view, '_probe_marker_actors', None)
 
-                    if geo_view and hasattr(geo_view, '_probe_marker_actors') and geo_view._probe_marker_actors:
+        if markers:
 
-                        for _m in geo_view._probe_marker_actors:
+            for _m in markers:
 
-                            _m.SetVisibility(True)
+                _m.SetVisibility(visible)
 
-                        self.vtk_pre.vtk_widget.GetRenderWindow().Render()
+    def _ensure_vtk_handles(self) -> None:
 
-                else:
+        if self._render_window is None:
 
-                    self._show_mesh_objects()
+            self._render_window = self.vtk_pre.vtk_widget.GetRenderWindow()
 
-                    self._show_slice_toolbar("mesh")
+            self._renderer = self._render_window.GetRenderers().GetFirstRenderer()
 
-                    self.vtk_pre.set_visibility_mode("mesh")
+    def _render(self) -> None:
 
-                    geo_view = self.panel_views.get("geometry")
+        self._ensure_vtk_handles()
 
-                    if geo_view and hasattr(geo_view, '_probe_marker_actors') and geo_view._probe_marker_actors:
+        self._render_window.Render()
 
-                        for _m in geo_view._probe_marker_actors:
+    def _partition_actors(self):
 
-                            _m.SetVisibility(False)
+        geom_actors = []
 
-                        self.vtk_pre.vtk_widget.GetRenderWindow().Render()
+        mesh_actors = []
 
-    def _show_geometry_objects(self):
+        for obj in self.vtk_pre.obj_manager.get_all():
 
-        all_objs = self.vtk_pre.obj_manager.get_all()
+            group = getattr(obj, 'group', None)
 
-        renderer = self.vtk_pre.vtk_widget.GetRenderWindow().GetRenderers().GetFirstRenderer()
+            if group == "geometry":
 
-        geom_count = 0
+                geom_actors.append(obj.actor)
 
-        mesh_count = 0
+            elif group == "mesh":
 
-        for obj in all_objs:
+                mesh_actors.append(obj.actor)
 
-            if hasattr(obj, 'group'):
+        return geom_actors, mesh_actors
 
-                if obj.group == "geometry":
+    def _show_geometry_objects(self, render: bool = True):
 
-                    renderer.AddActor(obj.actor)
+        geom_actors, mesh_actors = self._partition_actors()
 
-                    obj.actor.SetVisibility(True)
+        self._ensure_vtk_handles()
 
-                    geom_count += 1
+        renderer = self._renderer
 
-                elif obj.group == "mesh":
+        for actor in geom_actors:
 
-                    obj.actor.SetVisibility(False)
+            renderer.AddActor(actor)
 
-                    mesh_count += 1
+            actor.SetVisibility(True)
 
-        mesh_view = self.panel_views.get("mesh")
+        for actor in mesh_actors:
 
-        if mesh_view:
+            actor.SetVisibility(False)
 
-            mesh_view._hide_slice_clip_actors()
+        self._mesh_view._hide_slice_clip_actors()
 
         self.vtk_pre.show_clip_actors_for_group("geometry")
 
         self.vtk_pre.hide_clip_actors_for_group("mesh")
 
-        self.vtk_pre.vtk_widget.GetRenderWindow().Render()
-
-    def _show_mesh_objects(self):
-
-        all_objs = self.vtk_pre.obj_manager.get_all()
-
-        geom_count = 0
+        if render:
 
-        mesh_count = 0
+            self._render()
 
-        for obj in all_objs:
+    def _set_mesh_actors_visible(self) -> None:
 
-            if hasattr(obj, 'group'):
+        geom_actors, mesh_actors = self._partition_actors()
 
-                if obj.group == "geometry":
+        for actor in geom_actors:
 
-                    obj.actor.SetVisibility(False)
+            actor.SetVisibility(False)
 
-                    geom_count += 1
+        for actor in mesh_actors:
 
-                elif obj.group == "mesh":
+            actor.SetVisibility(True)
 
-                    obj.actor.SetVisibility(True)
+    def _show_mesh_objects(self, render: bool = True):
 
-                    mesh_count += 1
+        self._set_mesh_actors_visible()
 
-        mesh_view = self.panel_views.get("mesh")
-
-        if mesh_view:
-
-            mesh_view._show_slice_clip_actors()
+        self._mesh_view._show_slice_clip_actors()
 
         self.vtk_pre.hide_clip_actors_for_group("geometry")
 
         self.vtk_pre.show_clip_actors_for_group("mesh")
 
-        self.vtk_pre.vtk_widget.GetRenderWindow().Render()
-
-    def _show_mesh_objects_only(self):
-
-        all_objs = self.vtk_pre.obj_manager.get_all()
-
-        geom_count = 0
-
-        mesh_count = 0
+        if render:
 
-        for obj in all_objs:
+            self._render()
 
-            if hasattr(obj, 'group'):
+    def _show_mesh_objects_only(self):
 
-                if obj.group == "geometry":
+        self._set_mesh_actors_visible()
 
-                    obj.actor.SetVisibility(False)
+        self._mesh_view._hide_slice_clip_actors()
 
-                    geom_count += 1
+        self.vtk_pre.hide_clip_actors_for_group("geometry")
 
-                elif obj.group == "mesh":
+        self._render()
 
-                    obj.actor.SetVisibility(True)
+    def _show_slice_toolbar(self, mode: str = "mesh"):
 
-                    mesh_count += 1
+        for key, widget in self._slice_widgets.items():
 
-        mesh_view = self.panel_views.get("mesh")
+            if widget:
 
-        if mesh_view:
+                widget.setVisible(key == mode)
 
-            mesh_view._hide_slice_clip_actors()
+    def _hide_slice_toolbar(self):
 
-        self.vtk_pre.hide_clip_actors_for_group("geometry")
+        for widget in self._slice_widgets.values():
 
-        self.vtk_pre.vtk_widget.GetRenderWindow().Render()
+            if widget:
 
-    def _show_slice_toolbar(self, mode: str = "mesh"):
+                widget.hide()
 
-        geometry_view = self.panel_views.get("geometry")
+    def _schedule_residual_log(self):
 
-        mesh_view = self.panel_views.get("mesh")
+        QTimer.singleShot(0, self._load_residual_log)
 
-        if mode == "geometry":
-
-            if geometry_view and hasattr(geometry_view, "slice_widget") and geometry_view.slice_widget:
+    def _load_residual_log(self):
 
-                geometry_view.slice_widget.show()
+        if not self.residual_graph:
 
-            if mesh_view and hasattr(mesh_view, "slice_widget") and mesh_view.slice_widget:
+            return
 
-                mesh_view.slice_widget.hide()
+        if not case_data.path:
 
-        else:
+            return
 
-            if mesh_view and hasattr(mesh_view, "slice_widget") and mesh_view.slice_widget:
+        log_file = self._find_residual_log(case_data.path)
 
-                mesh_view.slice_widget.show()
+        if log_file:
 
-            if geometry_view and hasattr(geometry_view, "slice_widget") and geometry_view.slice_widget:
+            self.residual_graph.load_file(log_file, target_vars=['h', 'p', 'rho'])
 
-                geometry_view.slice_widget.hide()
+    def _find_residual_log(self, case_path):
 
-    def _hide_slice_toolbar(self):
+        chtf_case = os.path.join(case_path, "5.CHTFCase")
 
-        geometry_view = self.panel_views.get("geometry")
+        try:
 
-        mesh_view = self.panel_views.get("mesh")
+            key = (case_path, os.stat(chtf_case).st_mtime_ns)
 
-        if geometry_view and hasattr(geometry_view, "slice_widget") and geometry_view.slice_widget:
+        except OSError:
 
-            geometry_view.slice_widget.hide()
+            return None
 
-        if mesh_view and hasattr(mesh_view, "slice_widget") and mesh_view.slice_widget:
+        if key != self._residual_log_key:
 
-            mesh_view.slice_widget.hide()
+            self._residual_log_key = key
 
-    def _load_residual_log(self):
+            self._residual_log_file = None
 
-        if not self.residual_graph:
+            for name in ("log.Solver", "log.solver"):
 
-            return
+                log_file = os.path.join(chtf_case, name)
 
-        if not case_data.path:
+                if os.path.exists(log_file):
 
-            return
+                    self._residual_log_file = log_file
 
-        chtf_case = Path(case_data.path) / "5.CHTFCase"
+                    break
 
-        log_file = chtf_case / "log.Solver"
+        return self._residual_log_file
 
-        if not log_file.exists():
+    def _load_post_results(self):
 
-            log_file = chtf_case / "log.solver"
+        post_view = self.panel_views.get("post")
 
-        if log_file.exists():
+        if post_view and not getattr(post_view, '_results_loaded', False):
 
-            self.residual_graph.load_file(str(log_file), target_vars=['h', 'p', 'rho'])
+            post_view.load_results()
 
     def get_panel(self, panel_id: str):
 
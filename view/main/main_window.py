@@ -3,17 +3,19 @@ import shutil
 
 import traceback
 
+from functools import partial
+
 from pathlib import Path
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QLabel, QMessageBox,
     QGroupBox, QPushButton, QCheckBox, QComboBox, QProgressBar,
-    QToolButton, QTextEdit, QInputDialog, QFileDialog
+    QToolButton, QTextEdit, QInputDialog, QFileDialog, QProgressDialog
 )
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Slot, Signal, QObject, QRunnable, QThreadPool
 
-from PySide6.QtGui import QAction
+from PySide6.QtGui import QAction, QActionGroup
 
 from view.style.theme import toggle_theme, get_current_mode, get_colors
 
@@ -27,8 +29,6 @@ from nextlib.graph.pyqtgraph.residual_plot_widget import ResidualPlotWidget
 
 from nextlib.utils.window import center_on_screen, save_window_geometry, restore_window_geometry
 
-from nextlib.utils.file import copy_files
-
 from nextlib.dialogbox.dialogbox import DirDialogBox
 
 from common.app_data import app_data
@@ -37,166 +37,194 @@ from common.case_data import case_data
 
 from common.app_context import AppContext
 
+from common.file_utils import fast_copytree
+
 from view.main.menu_handler import MenuHandler
 
 from view.main.center_widget import CenterWidget
 
-class MainWindow(QMainWindow):
+def _remove_tree(path: str) -> None:
 
-    def __init__(self, case_path: str = ""):
+    shutil.rmtree(path, ignore_errors=True)
 
-        super().__init__()
+def _prepare_case(old_temp, base_case, case_path: str) -> None:
 
-        self.case_path = case_path
+    if old_temp:
 
-        self.app_data = app_data
+        _remove_tree(old_temp)
 
-        self.case_data = case_data
+    if base_case:
 
-        self.context = AppContext()
+        fast_copytree(base_case, case_path)
 
-        self.exec_widget = None
+def _move_case(src: str, dst: str, remove_src: bool) -> None:
 
-        self.vtk_pre = None
+    fast_copytree(src, dst)
 
-        self.vtk_post = None
+    if remove_src:
 
-        self.residual_graph = None
+        _remove_tree(src)
 
-        self.dock_manager = None
+class _FileTaskSignals(QObject):
 
-        self.center_widget = None
+    finished = Signal()
 
-        self.menu_handler = None
+    error = Signal(object)
 
-        self._setup_menu()
+class _FileTask(QRunnable):
 
-        self._setup_components()
+    def __init__(self, fn, *args):
 
-        self._setup_dock()
+        super().__init__()
 
-        self._setup_window()
+        self.fn = fn
 
-    def _setup_menu(self) -> None:
+        self.args = args
 
-        menubar = self.menuBar()
+        self.exc = None
 
-        file_menu = menubar.addMenu("&File")
+        self.then = None
 
-        self.action_new = QAction("&New", self)
+        self.signals = _FileTaskSignals()
 
-        self.action_new.setShortcut("Ctrl+N")
+    def run(self) -> None:
 
-        file_menu.addAction(self.action_new)
+        try:
 
-        self.action_open = QAction("&Open...", self)
+            self.fn(*self.args)
 
-        self.action_open.setShortcut("Ctrl+O")
+        except Exception as e:
 
-        file_menu.addAction(self.action_open)
+            self.exc = e
 
-        self.menu_recent = file_menu.addMenu("Open &Recent")
+            self.signals.error.emit(e)
 
-        self._update_recent_menu()
+        self.signals.finished.emit()
 
-        self.action_save = QAction("&Save", self)
+class MainWindow(QMainWindow):
 
-        self.action_save.setShortcut("Ctrl+S")
+    _MENU_SPEC = (
+        ("&File", (
+            ("action", "&New", "Ctrl+N", "action_new"),
+            ("action", "&Open...", "Ctrl+O", "action_open"),
+            ("recent",),
+            ("action", "&Save", "Ctrl+S", "action_save"),
+            ("action", "Save &As...", "Ctrl+Shift+S", "action_save_as"),
+            ("separator",),
+            ("action", "E&xit", "Alt+F4", "action_exit"),
+        )),
+        ("&Run", (
+            ("action", "&Run", "F5", "action_run"),
+            ("action", "&Stop", None, "action_stop"),
+        )),
+        ("&View", (
+            ("dock", "&Mesh", 2, "action_view_mesh"),
+            ("dock", "&Post", 3, "action_view_post"),
+            ("dock", "&Residuals", 4, "action_view_residuals"),
+            ("dock", "&Log", 1, "action_view_log"),
+        )),
+        ("&Tools", (
+            ("action", "Open &File Explorer", None, "action_file_explorer"),
+            ("action", "Open &Terminal", None, "action_terminal"),
+        )),
+        ("&Help", (
+            ("action", "&About", None, "action_about"),
+        )),
+    )
 
-        self.action_save.triggered.connect(self._on_save_clicked)
+    def __init__(self, case_path: str = ""):
 
-        file_menu.addAction(self.action_save)
+        super().__init__()
 
-        self.action_save_as = QAction("Save &As...", self)
+        self.case_path = case_path
 
-        self.action_save_as.setShortcut("Ctrl+Shift+S")
+        self.app_data = app_data
 
-        file_menu.addAction(self.action_save_as)
+        self.case_data = case_data
 
-        file_menu.addSeparator()
+        self.context = AppContext()
 
-        self.action_exit = QAction("E&xit", self)
+        self.exec_widget = None
 
-        self.action_exit.setShortcut("Alt+F4")
+        self.vtk_pre = None
 
-        file_menu.addAction(self.action_exit)
+        self.vtk_post = None
 
-        run_menu = menubar.addMenu("&Run")
+        self.residual_graph = None
 
-        self.action_run = QAction("&Run", self)
+        self.dock_manager = None
 
-        self.action_run.setShortcut("F5")
+        self.center_widget = None
+
+        self.menu_handler = None
 
-        run_menu.addAction(self.action_run)
+        self._file_task = None
 
-        self.action_stop = QAction("&Stop", self)
+        self._file_task_dialog = None
 
-        run_menu.addAction(self.action_stop)
+        self._closing_confirmed = False
+
+        self._setup_menu()
 
-        view_menu = menubar.addMenu("&View")
+        self._setup_components()
 
-        self.action_view_mesh = QAction("&Mesh", self)
+        self._setup_dock()
 
-        self.action_view_mesh.setCheckable(True)
+        self._setup_window()
 
-        self.action_view_mesh.setChecked(True)
+    def _setup_menu(self) -> None:
 
-        self.action_view_mesh.triggered.connect(lambda checked: self._on_view_dock_toggled(2, checked))
+        menubar = self.menuBar()
 
-        view_menu.addAction(self.action_view_mesh)
+        self._dock_view_actions = {}
 
-        self.action_view_post = QAction("&Post", self)
+        self.view_action_group = QActionGroup(self)
 
-        self.action_view_post.setCheckable(True)
+        self.view_action_group.setExclusive(False)
 
-        self.action_view_post.setChecked(True)
+        self.view_action_group.triggered.connect(self._on_view_action_triggered)
 
-        self.action_view_post.triggered.connect(lambda checked: self._on_view_dock_toggled(3, checked))
+        for title, items in self._MENU_SPEC:
 
-        view_menu.addAction(self.action_view_post)
+            menu = menubar.addMenu(title)
 
-        self.action_view_residuals = QAction("&Residuals", self)
+            for kind, *args in items:
 
-        self.action_view_residuals.setCheckable(True)
+                if kind == "separator":
 
-        self.action_view_residuals.setChecked(True)
+                    menu.addSeparator()
 
-        self.action_view_residuals.triggered.connect(lambda checked: self._on_view_dock_toggled(4, checked))
+                elif kind == "recent":
 
-        view_menu.addAction(self.action_view_residuals)
+                    self.menu_recent = menu.addMenu("Open &Recent")
 
-        self.action_view_log = QAction("&Log", self)
+                    self._update_recent_menu()
 
-        self.action_view_log.setCheckable(True)
+                elif kind == "dock":
 
-        self.action_view_log.setChecked(True)
+                    text, dock_num, name = args
 
-        self.action_view_log.triggered.connect(lambda checked: self._on_view_dock_toggled(1, checked))
+                    setattr(self, name, self._add_dock_view_action(menu, text, dock_num))
 
-        view_menu.addAction(self.action_view_log)
+                elif kind == "action":
 
-        self._dock_view_actions = {
-            1: self.action_view_log,
-            2: self.action_view_mesh,
-            3: self.action_view_post,
-            4: self.action_view_residuals,
-        }
+                    text, shortcut, name = args
 
-        tools_menu = menubar.addMenu("&Tools")
+                    action = QAction(text, self)
 
-        self.action_file_explorer = QAction("Open &File Explorer", self)
+                    if shortcut:
 
-        tools_menu.addAction(self.action_file_explorer)
+                        action.setShortcut(shortcut)
 
-        self.action_terminal = QAction("Open &Terminal", self)
+                    menu.addAction(action)
 
-        tools_menu.addAction(self.action_terminal)
+                    setattr(self, name, action)
 
-        help_menu = menubar.addMenu("&Help")
+                else:
 
-        self.action_about = QAction("&About", self)
+                    raise ValueError(f"Unknown menu item kind: {kind}")
 
-        help_menu.addAction(self.action_about)
+        self.action_save.triggered.connect(self._on_save_clicked)
 
         menubar.setCornerWidget(self._create_theme_toggle(), Qt.Corner.TopRightCorner)
 
@@ -204,6 +232,24 @@ class MainWindow(QMainWindow):
 
         self.menu_handler.connect_actions()
 
+    def _add_dock_view_action(self, menu, text: str, dock_num: int) -> QAction:
+
+        action = QAction(text, self)
+
+        action.setCheckable(True)
+
+        action.setChecked(True)
+
+        action.setData(dock_num)
+
+        self.view_action_group.addAction(action)
+
+        menu.addAction(action)
+
+        self._dock_view_actions[dock_num] = action
+
+        return action
+
     def _setup_components(self) -> None:
 
         self.exec_widget = ExecWidget(self)
@@ -400,6 +446,12 @@ class MainWindow(QMainWindow):
 
                 probe_tool.set_center(x, y, z)
 
+    @Slot(QAction)
+
+    def _on_view_action_triggered(self, action: QAction) -> None:
+
+        self._on_view_dock_toggled(action.data(), action.isChecked())
+
     def _on_view_dock_toggled(self, dock_num: int, checked: bool) -> None:
 
         if not self.dock_manager:
@@ -454,17 +506,25 @@ class MainWindow(QMainWindow):
 
         self.center_widget = CenterWidget(self, self.context)
 
-        self.dock_manager.add_center_dock(self.center_widget)
+        self.setUpdatesEnabled(False)
+
+        try:
+
+            self.dock_manager.add_center_dock(self.center_widget)
+
+            self.dock_manager.add_side_dock(self.exec_widget, "Log", area="bottom")
+
+            self.dock_manager.add_side_dock(self.vtk_pre, "Mesh", is_tab=True)
 
-        self.dock_manager.add_side_dock(self.exec_widget, "Log", area="bottom")
+            self.dock_manager.add_side_dock(self.vtk_post, "Post", is_tab=True)
 
-        self.dock_manager.add_side_dock(self.vtk_pre, "Mesh", is_tab=True)
+            self.dock_manager.add_side_dock(self.residual_graph, "Residuals", is_tab=True)
 
-        self.dock_manager.add_side_dock(self.vtk_post, "Post", is_tab=True)
+            self.dock_manager.change_dock_tab(2)
 
-        self.dock_manager.add_side_dock(self.residual_graph, "Residuals", is_tab=True)
+        finally:
 
-        self.dock_manager.change_dock_tab(2)
+            self.setUpdatesEnabled(True)
 
     def _setup_window(self) -> None:
 
@@ -554,11 +614,13 @@ class MainWindow(QMainWindow):
 
             self._create_case_from_template(case_path)
 
-        self.case_data.set_path(str(path.resolve()))
+        resolved = str(path.resolve())
+
+        self.case_data.set_path(resolved)
 
         self.case_data.load()
 
-        self.exec_widget.set_working_path(str(path.resolve()))
+        self.exec_widget.set_working_path(resolved)
 
     def _create_case_from_template(self, case_path: str) -> None:
 
@@ -572,7 +634,7 @@ class MainWindow(QMainWindow):
 
         try:
 
-            copy_files(str(base_case_path), case_path)
+            fast_copytree(str(base_case_path), case_path)
 
         except Exception as e:
 
@@ -588,9 +650,9 @@ class MainWindow(QMainWindow):
 
             return
 
-        self._delete_temp_case()
+        self._begin_case_switch(path, None, self._finish_open_case)
 
-        self._reset_all_state()
+    def _finish_open_case(self, path: str, exc) -> None:
 
         self.case_path = path
 
@@ -622,13 +684,15 @@ class MainWindow(QMainWindow):
 
             path = str(Path(self.app_data.user_path) / "temp" / f"temp_{timestamp}")
 
-        self._delete_temp_case()
+        base_case_path = self.app_data.get_config_basecase_path()
 
-        self._reset_all_state()
+        base_case = str(base_case_path) if base_case_path.exists() else None
 
-        self.case_path = path
+        self._begin_case_switch(path, base_case, self._finish_new_case)
 
-        self._create_case_from_template(path)
+    def _finish_new_case(self, path: str, exc) -> None:
+
+        self.case_path = path
 
         self._load_case(path)
 
@@ -636,47 +700,80 @@ class MainWindow(QMainWindow):
 
         self._update_window_title()
 
+    def _begin_case_switch(self, path: str, base_case, then) -> None:
+
+        """이전 temp 삭제와 템플릿 복사를 백그라운드로 실행한 뒤 then(path, exc)로 이어서 로드"""
+
+        if self._file_task:
+
+            return
+
+        self._flush_pending_saves()
+
+        self._reset_all_state()
+
+        old_temp = self.case_path if self.case_path and "temp" in self.case_path else None
+
+        if not old_temp and not base_case:
+
+            then(path, None)
+
+            return
+
+        self._start_file_task(
+            "Preparing case...", _prepare_case, old_temp, base_case, path,
+            then=partial(then, path)
+        )
+
     def _update_recent_menu(self) -> None:
 
         """최근 케이스 서브메뉴를 app_data.recent_cases로 갱신"""
 
-        self.menu_recent.clear()
+        menu = self.menu_recent
+
+        menu.clear()
+
+        add_action = menu.addAction
 
         recent = self.app_data.recent_cases
 
         if not recent:
 
-            action = self.menu_recent.addAction("(없음)")
+            action = add_action("(없음)")
 
             action.setEnabled(False)
 
             return
 
+        labels = []
+
         for i, path in enumerate(recent):
 
             display = path if len(path) <= 55 else f"...{path[-52:]}"
 
-            action = self.menu_recent.addAction(f"&{i + 1}. {display}" if i < 9 else f"{i + 1}. {display}")
+            labels.append(f"&{i + 1}. {display}" if i < 9 else f"{i + 1}. {display}")
 
-            action.triggered.connect(lambda checked=False, p=path: self.open_case(p) if Path(p).exists() else QMessageBox.warning(self, "경고", f"경로가 존재하지 않습니다:\n{p}"))
+        for path, label in zip(recent, labels):
 
-        self.menu_recent.addSeparator()
+            action = add_action(label)
 
-        remove_menu = self.menu_recent.addMenu("항목 제거")
+            action.triggered.connect(lambda checked=False, p=path: self.open_case(p) if Path(p).exists() else QMessageBox.warning(self, "경고", f"경로가 존재하지 않습니다:\n{p}"))
 
-        for i, path in enumerate(recent):
+        menu.addSeparator()
 
-            display = path if len(path) <= 55 else f"...{path[-52:]}"
+        remove_menu = menu.addMenu("항목 제거")
 
-            label = f"&{i + 1}. {display}" if i < 9 else f"{i + 1}. {display}"
+        add_remove = remove_menu.addAction
 
-            remove_action = remove_menu.addAction(label)
+        for path, label in zip(recent, labels):
+
+            remove_action = add_remove(label)
 
             remove_action.triggered.connect(lambda checked=False, p=path: self._remove_recent_case(p))
 
-        self.menu_recent.addSeparator()
+        menu.addSeparator()
 
-        clear_action = self.menu_recent.addAction("목록 전체 지우기")
+        clear_action = add_action("목록 전체 지우기")
 
         clear_action.triggered.connect(self._clear_recent_cases)
 
@@ -792,6 +889,18 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
 
+        if self._closing_confirmed:
+
+            event.accept()
+
+            return
+
+        if self._file_task:
+
+            event.ignore()
+
+            return
+
         if self.case_path and "temp" in self.case_path:
 
             if not self._handle_temp_case_close():
@@ -804,10 +913,23 @@ class MainWindow(QMainWindow):
 
         if self.case_path and "temp" in self.case_path:
 
-            self._delete_temp_case()
+            self._start_file_task(
+                "Deleting temporary case...", _remove_tree, self.case_path,
+                then=self._finish_close
+            )
+
+            event.ignore()
+
+            return
 
         event.accept()
 
+    def _finish_close(self, exc) -> None:
+
+        self._closing_confirmed = True
+
+        self.close()
+
     def _handle_temp_case_close(self) -> bool:
 
         reply = QMessageBox.question(
@@ -880,6 +1002,8 @@ class MainWindow(QMainWindow):
 
     def _save_temp_case_as(self) -> bool:
 
+        self._flush_pending_saves()
+
         new_path = self._pick_save_path("Save Case As")
 
         if not new_path:
@@ -893,89 +1017,122 @@ class MainWindow(QMainWindow):
                 QMessageBox.StandardButton.No
             )
 
-            if reply == QMessageBox.StandardButton.Yes:
+            return reply == QMessageBox.StandardButton.Yes
 
-                self._delete_temp_case()
+        self._start_case_save(new_path, then=self.close)
 
-                return True
+        return False
 
-            else:
+    def save_case_as(self) -> bool:
 
-                return False
+        self._flush_pending_saves()
 
-        try:
+        new_path = self._pick_save_path("Save Case As")
+
+        if not new_path:
 
-            copy_files(self.case_path, new_path)
+            return False
 
-            old_temp = self.case_path
+        return self._start_case_save(new_path)
 
-            self.case_path = new_path
+    def _start_case_save(self, new_path: str, then=None) -> bool:
 
-            self.case_data.set_path(new_path)
+        if self._file_task:
 
-            shutil.rmtree(old_temp, ignore_errors=True)
+            return False
 
-            self._update_window_title()
+        old_path = self.case_path
 
-            return True
+        self._start_file_task(
+            "Saving case...", _move_case, old_path, new_path, "temp" in old_path,
+            then=partial(self._finish_case_save, new_path, then)
+        )
 
-        except Exception as e:
+        return True
 
-            QMessageBox.critical(
-                self,
-                'Save Error',
-                f'Failed to save case:\n{e}'
-            )
+    def _finish_case_save(self, new_path: str, then, exc) -> None:
 
-            return False
+        if exc:
 
-    def save_case_as(self) -> bool:
+            QMessageBox.critical(self, 'Save Error', f'Failed to save case:\n{exc}')
 
-        new_path = self._pick_save_path("Save Case As")
+            return
 
-        if not new_path:
+        self.case_path = new_path
 
-            return False
+        self.case_data.set_path(new_path)
 
-        try:
+        self._update_window_title()
 
-            copy_files(self.case_path, new_path)
+        self.statusBar().showMessage(f"Saved to {new_path}", 3000)
 
-            is_temp = "temp" in self.case_path
+        if then:
 
-            old_path = self.case_path
+            then()
 
-            self.case_path = new_path
+    def _flush_pending_saves(self) -> None:
 
-            self.case_data.set_path(new_path)
+        geom_panel = self.center_widget.panel_views.get("geometry")
 
-            if is_temp:
+        if geom_panel:
 
-                shutil.rmtree(old_path, ignore_errors=True)
+            geom_panel.flush_pending_save()
 
-            self._update_window_title()
+    def _start_file_task(self, label: str, fn, *args, then=None) -> _FileTask:
 
-            self.statusBar().showMessage(f"Saved to {new_path}", 3000)
+        """파일 작업을 스레드 풀에서 실행하고, 끝나면 진행 창을 닫고 then(exc) 호출"""
 
-            return True
+        if self._file_task:
 
-        except Exception as e:
+            raise RuntimeError("Another file operation is still running")
 
-            QMessageBox.critical(self, 'Save Error', f'Failed to save case:\n{e}')
+        task = _FileTask(fn, *args)
 
-            return False
+        task.then = then
 
-    def _delete_temp_case(self) -> None:
+        dialog = QProgressDialog(label, None, 0, 0, self)
 
-        if self.case_path and "temp" in self.case_path:
+        dialog.setCancelButton(None)
+
+        dialog.setMinimumDuration(0)
+
+        dialog.open()
+
+        self._file_task = task
+
+        self._file_task_dialog = dialog
+
+        task.signals.error.connect(self._on_file_task_error)
+
+        task.signals.finished.connect(self._on_file_task_finished)
+
+        QThreadPool.globalInstance().start(task)
+
+        return task
 
-            try:
+    def _on_file_task_error(self, exc: Exception) -> None:
 
-                shutil.rmtree(self.case_path, ignore_errors=True)
+        traceback.print_exception(exc)
 
-            except Exception:
+    def _on_file_task_finished(self) -> None:
 
-                traceback.print_exc()
+        task = self._file_task
+
+        dialog = self._file_task_dialog
+
+        if dialog:
+
+            dialog.close()
+
+            dialog.deleteLater()
+
+        self._file_task_dialog = None
+
+        self._file_task = None
+
+        if task and task.then:
+
+            task.then(task.exc)
 
     def _cleanup(self) -> None:
 
@@ -989,6 +1146,8 @@ class MainWindow(QMainWindow):
 
         self.app_data.save()
 
+        self._flush_pending_saves()
+
         if self.case_data.path and "temp" not in self.case_path:
 
             self.case_data.save()
@@ -1,4 +1,8 @@
 
+from PySide6.QtCore import QObject, Slot
+
+from PySide6.QtGui import QAction
+
 from PySide6.QtWidgets import QMessageBox
 
 from nextlib.program.program import open_file_explorer
@@ -7,10 +11,12 @@ from common.app_data import app_data
 
 from common.case_data import case_data
 
-class MenuHandler:
+class MenuHandler(QObject):
 
     def __init__(self, main_window):
 
+        super().__init__(main_window)
+
         self.main_window = main_window
 
         self.app_data = app_data
@@ -35,13 +41,14 @@ class MenuHandler:
 
         mw.action_stop.triggered.connect(self.on_stop)
 
-        mw.action_view_mesh.triggered.connect(self.on_view_mesh)
+        self._view_handlers = {
+            mw.action_view_mesh: self.on_view_mesh,
+            mw.action_view_post: self.on_view_post,
+            mw.action_view_residuals: self.on_view_residuals,
+            mw.action_view_log: self.on_view_log,
+        }
 
-        mw.action_view_post.triggered.connect(self.on_view_post)
-
-        mw.action_view_residuals.triggered.connect(self.on_view_residuals)
-
-        mw.action_view_log.triggered.connect(self.on_view_log)
+        mw.view_action_group.triggered.connect(self.on_view_action)
 
         mw.action_file_explorer.triggered.connect(self.on_file_explorer)
 
@@ -49,14 +56,20 @@ class MenuHandler:
 
         mw.action_about.triggered.connect(self.on_about)
 
+    @Slot()
+
     def on_new(self) -> None:
 
         self.main_window.create_new_case(user_select=True)
 
+    @Slot()
+
     def on_open(self) -> None:
 
         self.main_window.open_case()
 
+    @Slot()
+
     def on_save(self) -> None:
 
         if self.case_data.path:
@@ -67,44 +80,72 @@ class MenuHandler:
 
             self.on_save_as()
 
+    @Slot()
+
     def on_save_as(self) -> None:
 
         self.main_window.save_case_as()
 
+    @Slot()
+
     def on_exit(self) -> None:
 
         self.main_window.close()
 
+    @Slot()
+
     def on_run(self) -> None:
 
         self.main_window.statusBar().showMessage("Run - Not implemented yet", 3000)
 
+    @Slot()
+
     def on_stop(self) -> None:
 
         self.main_window.statusBar().showMessage("Stop - Not implemented yet", 3000)
 
+    @Slot(QAction)
+
+    def on_view_action(self, action: QAction) -> None:
+
+        handler = self._view_handlers.get(action)
+
+        if handler:
+
+            handler()
+
+    @Slot()
+
     def on_view_mesh(self) -> None:
 
         if self.main_window.dock_manager:
 
             self.main_window.dock_manager.change_dock_tab(2)
 
+    @Slot()
+
     def on_view_post(self) -> None:
 
         if self.main_window.dock_manager:
 
             self.main_window.dock_manager.change_dock_tab(3)
 
+    @Slot()
+
     def on_view_residuals(self) -> None:
 
         if self.main_window.dock_manager:
 
             self.main_window.dock_manager.change_dock_tab(0)
 
+    @Slot()
+
     def on_view_log(self) -> None:
 
         self.main_window.statusBar().showMessage("Log panel is at the bottom", 2000)
 
+    @Slot()
+
     def on_file_explorer(self) -> None:
 
         if self.case_data.path:
@@ -115,10 +156,14 @@ class MenuHandler:
 
             self.main_window.statusBar().showMessage("No case loaded", 2000)
 
+    @Slot()
+
     def on_terminal(self) -> None:
 
         self.main_window.statusBar().showMessage("Terminal - Not implemented yet", 3000)
 
+    @Slot()
+
     def on_about(self) -> None:
 
         QMessageBox.about(
@@ -1,4 +1,6 @@
 
+import shutil
+
 import traceback
 
 from pathlib import Path
@@ -8,7 +10,7 @@ from PySide6.QtWidgets import (
     QHeaderView, QDoubleSpinBox
 )
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 
 from PySide6.QtGui import QFont
 
@@ -73,6 +75,16 @@ from common.case_data import case_data
 
 class GeometryView:
 
+    __slots__ = (
+        "app_data", "case_data", "ctx", "exec_widget", "mesh_loader", "parent",
+        "slice_widget", "tree", "ui", "vtk_pre", "_clip_combo",
+        "_clip_flip_btn", "_clip_reset_btn", "_clip_slider", "_clip_spin_nx",
+        "_clip_spin_ny", "_clip_spin_nz", "_flat_geometries", "_lbl_pos_value",
+        "_loading_signals_connected", "_loading_total", "_probe_marker_actors",
+        "_save_timer", "_saved_projection", "_saved_view_style",
+        "_visibility_state", "__weakref__",
+    )
+
     ICON_VISIBLE = "\U0001F441"
 
     ICON_HIDDEN = "\u25CB"
@@ -115,10 +127,32 @@ class GeometryView:
 
         self._setup_visibility_tree()
 
+        self._save_timer = QTimer(self.parent)
+
+        self._save_timer.setSingleShot(True)
+
+        self._save_timer.setInterval(300)
+
+        self._save_timer.timeout.connect(self.case_data.save)
+
+        app = QApplication.instance()
+
+        if app:
+
+            app.aboutToQuit.connect(self.flush_pending_save)
+
         self.slice_widget = self._create_slice_widget()
 
         self._init_connect()
 
+    def flush_pending_save(self):
+
+        if self._save_timer.isActive():
+
+            self._save_timer.stop()
+
+            self.case_data.save()
+
     def _setup_visibility_tree(self):
 
         tree_widget = self.tree.widget
@@ -127,6 +161,8 @@ class GeometryView:
 
         tree_widget.setHeaderHidden(True)
 
+        tree_widget.setUniformRowHeights(True)
+
         header = tree_widget.header()
 
         header.setStretchLastSection(False)
@@ -329,9 +365,11 @@ class GeometryView:
 
         self._visibility_state[name] = visible
 
-        for i in range(self.tree.widget.topLevelItemCount()):
+        tree_widget = self.tree.widget
 
-            item = self.tree.widget.topLevelItem(i)
+        for i in reversed(range(tree_widget.topLevelItemCount())):
+
+            item = tree_widget.topLevelItem(i)
 
             if item and item.text(0) == name:
 
@@ -367,9 +405,11 @@ class GeometryView:
 
         self._visibility_state[name] = visible
 
-        for i in range(self.tree.widget.topLevelItemCount()):
+        tree_widget = self.tree.widget
 
-            item = self.tree.widget.topLevelItem(i)
+        for i in reversed(range(tree_widget.topLevelItemCount())):
+
+            item = tree_widget.topLevelItem(i)
 
             if item and item.text(0) == name:
 
@@ -397,38 +437,48 @@ class GeometryView:
 
         copied_files = []
 
-        for f in add_files:
+        tree_widget = self.tree.widget
 
-            src_file = Path(f)
+        tree_names = {
+            tree_widget.topLevelItem(i).text(0)
+            for i in range(tree_widget.topLevelItemCount())
+        }
 
-            dst_file = model_path / src_file.name
+        tree_widget.setUpdatesEnabled(False)
 
-            import shutil
+        try:
 
-            try:
+            for f in add_files:
 
-                shutil.copy2(src_file, dst_file)
+                src_file = Path(f)
 
-            except Exception:
+                dst_file = model_path / src_file.name
 
-                traceback.print_exc()
+                try:
 
-                continue
+                    shutil.copy2(src_file, dst_file)
 
-            name = dst_file.stem
+                except Exception:
 
-            self.case_data.add_geometry(dst_file)
+                    traceback.print_exc()
 
-            tree_names = [
-                self.tree.widget.topLevelItem(i).text(0)
-                for i in range(self.tree.widget.topLevelItemCount())
-            ]
+                    continue
 
-            if name not in tree_names:
+                name = dst_file.stem
 
-                self._add_tree_item_with_visibility(name, visible=True)
+                self.case_data.add_geometry(dst_file)
+
+                if name not in tree_names:
+
+                    self._add_tree_item_with_visibility(name, visible=True)
+
+                    tree_names.add(name)
 
-            copied_files.append(str(dst_file))
+                copied_files.append(str(dst_file))
+
+        finally:
+
+            tree_widget.setUpdatesEnabled(True)
 
         if self.vtk_pre and copied_files:
 
@@ -436,7 +486,7 @@ class GeometryView:
 
         else:
 
-            self.case_data.save()
+            self._save_timer.start()
 
     def _start_async_loading(self, files: list):
 
@@ -576,7 +626,7 @@ class GeometryView:
 
                     self.ui.button_geometry_apply.setEnabled(True)
 
-        self.case_data.save()
+        self._save_timer.start()
 
     def _apply_saved_transforms(self):
 
@@ -749,7 +799,7 @@ class GeometryView:
 
             self.vtk_pre.vtk_widget.GetRenderWindow().Render()
 
-        self.case_data.save()
+        self._save_timer.start()
 
     def _on_set_apply_clicked(self):
 
@@ -906,7 +956,7 @@ class GeometryView:
 
                             self.case_data.set_geometry_probe_position(obj_name, *probe_center)
 
-                        self.case_data.save()
+                        self._save_timer.start()
 
                     probe_tool.hide()
 
@@ -1776,8 +1826,8 @@ class GeometryView:
 
             from common.case_data import GeometryData
 
-            self.case_data.objects["fluid"] = GeometryData(
-                name="fluid", path="", is_visible=True
+            self.case_data.add_geometry_data(
+                GeometryData(name="fluid", path="", is_visible=True)
             )
 
         model_path = Path(self.case_data.path) / "1.model_Mhead" / "scale0"
@@ -1816,5 +1866,5 @@ class GeometryView:
 
         else:
 
-            self.case_data.save()
+            self._save_timer.start()
 
@@ -1,4 +1,6 @@
 
+import os
+
 import sys
 
 import subprocess
@@ -124,6 +126,18 @@ class PrepareMeshThread(QThread):
 
 class MeshGenerationView:
 
+    __slots__ = (
+        "app_data", "bounds", "case_data", "center", "clip_actor",
+        "clip_flip_btn", "clip_plane", "clip_reset_btn", "combo_dir", "ctx",
+        "diagonal_length", "exec_widget", "foam_reader", "geom_output",
+        "lbl_pos_value", "parent", "prepare_thread", "slice_widget",
+        "slider_pos", "spin_nx", "spin_ny", "spin_nz", "surface_actor", "ui",
+        "vtk_pre", "_blockmesh_cache", "_blockmesh_key", "_clip_clip_filter",
+        "_clip_flip", "_clip_geom_filter", "_clip_preview_actor",
+        "_error_highlighted_widget", "_error_original_style",
+        "_flat_geometries", "_log_dir", "_slice_update_timer", "__weakref__",
+    )
+
     def __init__(self, parent):
 
         self.parent = parent
@@ -172,6 +186,10 @@ class MeshGenerationView:
 
         self._slice_update_timer.timeout.connect(self.update_slice)
 
+        self._blockmesh_cache = None
+
+        self._blockmesh_key = None
+
         self.slice_widget = self._create_slice_widget()
 
         self._init_connect()
@@ -1011,6 +1029,36 @@ class MeshGenerationView:
 
             toolbar.setMovable(not lock)
 
+    def _load_blockmesh_dict(self, blockmesh_path: Path):
+
+        try:
+
+            key = (str(blockmesh_path), os.stat(blockmesh_path).st_mtime_ns)
+
+        except OSError:
+
+            self._blockmesh_cache = None
+
+            return None
+
+        if self._blockmesh_cache is not None and key == self._blockmesh_key:
+
+            return self._blockmesh_cache
+
+        foam_file = FoamFile(str(blockmesh_path))
+
+        if not foam_file.load():
+
+            self._blockmesh_cache = None
+
+            return None
+
+        self._blockmesh_cache = foam_file
+
+        self._blockmesh_key = key
+
+        return foam_file
+
     def _update_blockmesh_dict(self, cells_x: str, cells_y: str, cells_z: str, bounds=None) -> bool:
 
         if bounds is None:
@@ -1049,13 +1097,9 @@ class MeshGenerationView:
 
             blockmesh_path = case_path / "system" / "blockMeshDict"
 
-            if not blockmesh_path.exists():
-
-                return False
-
-            foam_file = FoamFile(str(blockmesh_path))
+            foam_file = self._load_blockmesh_dict(blockmesh_path)
 
-            if not foam_file.load():
+            if foam_file is None:
 
                 return False
 
@@ -1086,10 +1130,14 @@ class MeshGenerationView:
 
             foam_file.save()
 
+            self._blockmesh_key = (str(blockmesh_path), os.stat(blockmesh_path).st_mtime_ns)
+
             return True
 
         except Exception:
 
+            self._blockmesh_cache = None
+
             traceback.print_exc()
 
             return False
@@ -2047,7 +2095,7 @@ FoamFile
 
                     obj.name = region_name
 
-                    self.case_data.objects[region_name] = obj
+                    self.case_data.add_geometry_data(obj)
 
                 if self.case_data.set_geometry_probe_position(region_name, x, y, z):
 
@@ -2087,21 +2135,9 @@ FoamFile
 
             blockmesh_path = case_path / "system" / "blockMeshDict"
 
-            if not blockmesh_path.exists():
-
-                self.ui.lineEdit_basegrid_x.setText(default_cells[0])
-
-                self.ui.lineEdit_basegrid_y.setText(default_cells[1])
-
-                self.ui.lineEdit_basegrid_z.setText(default_cells[2])
-
-                return
-
-            foam_file = FoamFile(str(blockmesh_path))
-
-            load_result = foam_file.load()
+            foam_file = self._load_blockmesh_dict(blockmesh_path)
 
-            if not load_result:
+            if foam_file is None:
 
                 self.ui.lineEdit_basegrid_x.setText(default_cells[0])
 
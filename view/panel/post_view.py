@@ -18,6 +18,11 @@ from common.case_data import case_data
 
 class PostView:
 
+    __slots__ = (
+        "case_data", "parent", "vtk_post", "_results_loaded", "_spray_actor",
+        "_spray_thread", "_spray_worker", "__weakref__",
+    )
+
     def __init__(self, parent):
 
         self.parent = parent
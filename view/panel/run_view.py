@@ -23,6 +23,18 @@ from common.case_data import case_data
 
 class RunView:
 
+    __slots__ = (
+        "app_data", "case_data", "ctx", "exec_widget", "parent",
+        "residual_graph", "ui", "vtk_post", "vtk_pre", "_allclean_commands",
+        "_allrun_commands", "_button_initialize", "_error_highlighted_widget",
+        "_error_original_style", "_graph_update_interval",
+        "_graph_update_timer", "_is_resuming_from_pause", "_is_running",
+        "_is_stopping_gracefully", "_last_run_completed", "_log_check_interval",
+        "_log_dir", "_log_file_path", "_log_timer", "_log_watcher",
+        "_resume_prev_log", "_solver_numbered_log", "_solver_step_num",
+        "_step_tracker", "__weakref__",
+    )
+
     def __init__(self, parent):
 
         self.parent = parent
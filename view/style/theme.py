@@ -1,6 +1,8 @@
 
 import tempfile
 
+from functools import lru_cache
+
 from pathlib import Path
 
 from PySide6.QtWidgets import QApplication
@@ -141,7 +143,7 @@ def apply_theme(app: QApplication, mode: str = "light") -> None:
 
     _apply_palette(app, c)
 
-    app.setStyleSheet(_build_stylesheet(c))
+    app.setStyleSheet(_cached_stylesheet(mode))
 
 def toggle_theme(app: QApplication) -> str:
 
@@ -205,11 +207,17 @@ def _apply_palette(app: QApplication, c: dict) -> None:
 
     app.setPalette(p)
 
-def _generate_combo_arrows(c: dict) -> dict:
+def _theme_dir(mode: str) -> Path:
+
+    tmp = Path(tempfile.gettempdir()) / "bipropthrust_theme" / mode
+
+    tmp.mkdir(parents=True, exist_ok=True)
 
-    tmp = Path(tempfile.gettempdir()) / "bipropthrust_theme"
+    return tmp
 
-    tmp.mkdir(exist_ok=True)
+def _generate_combo_arrows(c: dict, mode: str) -> dict:
+
+    tmp = _theme_dir(mode)
 
     arrows = {}
 
@@ -243,11 +251,9 @@ def _generate_combo_arrows(c: dict) -> dict:
 
     return arrows
 
-def _generate_spin_arrows(c: dict) -> dict:
-
-    tmp = Path(tempfile.gettempdir()) / "bipropthrust_theme"
+def _generate_spin_arrows(c: dict, mode: str) -> dict:
 
-    tmp.mkdir(exist_ok=True)
+    tmp = _theme_dir(mode)
 
     arrows = {}
 
@@ -305,11 +311,9 @@ def _generate_spin_arrows(c: dict) -> dict:
 
     return arrows
 
-def _generate_tree_indicators(c: dict) -> dict:
+def _generate_tree_indicators(c: dict, mode: str) -> dict:
 
-    tmp = Path(tempfile.gettempdir()) / "bipropthrust_theme"
-
-    tmp.mkdir(exist_ok=True)
+    tmp = _theme_dir(mode)
 
     indicators = {}
 
@@ -411,13 +415,19 @@ def _generate_tree_indicators(c: dict) -> dict:
 
     return indicators
 
-def _build_stylesheet(c: dict) -> str:
+@lru_cache(maxsize=None)
+
+def _cached_stylesheet(mode: str) -> str:
+
+    return _build_stylesheet(_THEMES[mode], mode)
+
+def _build_stylesheet(c: dict, mode: str) -> str:
 
-    arrows = _generate_combo_arrows(c)
+    arrows = _generate_combo_arrows(c, mode)
 
-    spin_arrows = _generate_spin_arrows(c)
+    spin_arrows = _generate_spin_arrows(c, mode)
 
-    tree_indicators = _generate_tree_indicators(c)
+    tree_indicators = _generate_tree_indicators(c, mode)
 
     return f"""
         /* ===== QGroupBox ===== */